@@ -18,6 +18,7 @@ from models import (
     AccountType,
 )
 from advisor_storage import advisor_storage
+from ids import now_iso
 
 router = APIRouter(prefix="/admin", tags=["admin"])
 
@@ -244,7 +245,7 @@ async def review_compliance_item(item_id: str, review: ComplianceReviewRequest,
     item.status = review.status
     item.review_notes = review.review_notes
     item.reviewer_id = reviewer_id
-    item.reviewed_at = datetime.utcnow().isoformat()
+    item.reviewed_at = now_iso()
     
     await advisor_storage.save_compliance_item(item)
     return item
@@ -350,7 +351,7 @@ async def update_regulatory_rule(rule_id: str, update: RegulatoryRuleUpdateReque
     if update.current_values is not None:
         rule.current_values = update.current_values
     if update.account_types is not None:
-        rule.account_types = [AccountType(at) for at in update.account_types]
+        rule.account_types = tuple(AccountType(at) for at in update.account_types)
     if update.age_requirements is not None:
         rule.age_requirements = update.age_requirements
     if update.income_requirements is not None:
@@ -363,7 +364,7 @@ async def update_regulatory_rule(rule_id: str, update: RegulatoryRuleUpdateReque
         rule.is_active = update.is_active
     
     rule.updated_by = updated_by
-    rule.last_verified = datetime.utcnow().isoformat()
+    rule.last_verified = now_iso()
     
     await advisor_storage.save_regulatory_rule(rule)
     return rule
@@ -20,8 +20,10 @@ from models import (
     ResolutionType,
     Appointment,
     AppointmentStatus,
+    Jurisdiction,
 )
 from advisor_storage import advisor_storage
+from ids import now_iso
 
 router = APIRouter(prefix="/advisor", tags=["advisor"])
 
@@ -90,9 +92,9 @@ async def update_advisor(advisor_id: str, update: AdvisorUpdateRequest):
     if update.license_number is not None:
         advisor.license_number = update.license_number
     if update.jurisdictions is not None:
-        advisor.jurisdictions = update.jurisdictions
+        advisor.jurisdictions = tuple(Jurisdiction(j) for j in update.jurisdictions)
     if update.specializations is not None:
-        advisor.specializations = update.specializations
+        advisor.specializations = tuple(update.specializations)
     if update.bio is not None:
         advisor.bio = update.bio
     
@@ -297,7 +299,7 @@ async def update_escalation(escalation_id: str, update: EscalationUpdateRequest)
     if update.status is not None:
         escalation.status = update.status
         if update.status == EscalationStatus.IN_PROGRESS and not escalation.acknowledged_at:
-            escalation.acknowledged_at = datetime.utcnow().isoformat()
+            escalation.acknowledged_at = now_iso()
     
     if update.priority is not None:
         escalation.priority = update.priority
@@ -316,7 +318,7 @@ async def resolve_escalation(escalation_id: str, resolution: EscalationResolveRe
     escalation.status = EscalationStatus.RESOLVED
     escalation.resolution_type = resolution.resolution_type
     escalation.resolution_notes = resolution.resolution_notes
-    escalation.resolved_at = datetime.utcnow().isoformat()
+    escalation.resolved_at = now_iso()
     
     await advisor_storage.save_escalation(escalation)
     return escalation
@@ -341,7 +343,7 @@ async def get_advisor_appointments(
         appointments = [a for a in appointments if a.status.value == status]
     
     if upcoming_only:
-        now = datetime.utcnow().isoformat()
+        now = now_iso()
         appointments = [a for a in appointments if a.scheduled_at >= now]
     
     return appointments
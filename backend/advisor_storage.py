@@ -8,6 +8,7 @@ from datetime import datetime
 from pathlib import Path
 from typing import List, Optional, Dict, Any
 
+from ids import now_iso
 from models import (
     AdvisorProfile,
     AdminProfile,
@@ -31,6 +32,10 @@ class AdvisorStorage:
             data_dir = Path(__file__).parent / "data"
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        # client_id -> advisor_id, seeded from user_profiles.json and kept current by update_client
+        self._client_advisor_ids: Dict[str, Optional[str]] = {
+            c.get("id"): c.get("advisor_id") for c in self._load_json("user_profiles.json")
+        }
     
     def _load_json(self, filename: str) -> List[Dict]:
         """Load JSON array from file."""
@@ -68,7 +73,7 @@ class AdvisorStorage:
     async def save_advisor(self, advisor: AdvisorProfile) -> str:
         """Save or update advisor."""
         data = self._load_json("advisors.json")
-        advisor.updated_at = datetime.utcnow().isoformat()
+        advisor.updated_at = now_iso()
         advisor_dict = advisor.model_dump()
         
         existing_idx = next(
@@ -109,7 +114,7 @@ class AdvisorStorage:
     async def save_admin(self, admin: AdminProfile) -> str:
         """Save or update admin."""
         data = self._load_json("admins.json")
-        admin.updated_at = datetime.utcnow().isoformat()
+        admin.updated_at = now_iso()
         admin_dict = admin.model_dump()
         
         existing_idx = next(
@@ -144,6 +149,10 @@ class AdvisorStorage:
                 return ExtendedClientProfile(**c)
         return None
     
+    def get_client_advisor_id(self, client_id: str) -> Optional[str]:
+        """Get the advisor assigned to a client without reading the profiles file."""
+        return self._client_advisor_ids.get(client_id)
+
     async def get_all_clients(self) -> List[ExtendedClientProfile]:
         """Get all clients."""
         data = self._load_json("user_profiles.json")
@@ -152,7 +161,7 @@ class AdvisorStorage:
     async def update_client(self, client: ExtendedClientProfile) -> str:
         """Update client profile."""
         data = self._load_json("user_profiles.json")
-        client.updated_at = datetime.utcnow().isoformat()
+        client.updated_at = now_iso()
         client_dict = client.model_dump()
         
         existing_idx = next(
@@ -166,6 +175,7 @@ class AdvisorStorage:
             data.append(client_dict)
         
         self._save_json("user_profiles.json", data)
+        self._client_advisor_ids[client.id] = client.advisor_id
         return client.id
     
     # ─── Advisor Notes ───────────────────────────────────────────────────────
@@ -192,7 +202,7 @@ class AdvisorStorage:
     async def save_note(self, note: AdvisorNote) -> str:
         """Save or update note."""
         data = self._load_json("advisor_notes.json")
-        note.updated_at = datetime.utcnow().isoformat()
+        note.updated_at = now_iso()
         note_dict = note.model_dump()
         
         existing_idx = next(
@@ -252,21 +262,25 @@ class AdvisorStorage:
     
     async def save_escalation(self, escalation: EscalationTicket) -> str:
         """Save or update escalation."""
+        ids = await self.save_escalations([escalation])
+        return ids[0]
+    
+    async def save_escalations(self, escalations: List[EscalationTicket]) -> List[str]:
+        """Save or update several escalations with a single file read and write."""
         data = self._load_json("escalations.json")
-        escalation_dict = escalation.model_dump()
+        index_by_id = {e.get("id"): i for i, e in enumerate(data)}
         
-        existing_idx = next(
-            (i for i, e in enumerate(data) if e.get("id") == escalation.id),
-            None
-        )
-        
-        if existing_idx is not None:
-            data[existing_idx] = escalation_dict
-        else:
-            data.append(escalation_dict)
+        for escalation in escalations:
+            escalation_dict = escalation.model_dump()
+            existing_idx = index_by_id.get(escalation.id)
+            if existing_idx is not None:
+                data[existing_idx] = escalation_dict
+            else:
+                index_by_id[escalation.id] = len(data)
+                data.append(escalation_dict)
         
         self._save_json("escalations.json", data)
-        return escalation.id
+        return [e.id for e in escalations]
     
     # ─── Appointments ────────────────────────────────────────────────────────
     
@@ -296,7 +310,7 @@ class AdvisorStorage:
     async def save_appointment(self, appointment: Appointment) -> str:
         """Save or update appointment."""
         data = self._load_json("appointments.json")
-        appointment.updated_at = datetime.utcnow().isoformat()
+        appointment.updated_at = now_iso()
         appointment_dict = appointment.model_dump()
         
         existing_idx = next(
@@ -405,7 +419,7 @@ class AdvisorStorage:
     async def save_regulatory_rule(self, rule: RegulatoryRule) -> str:
         """Save or update regulatory rule."""
         data = self._load_json("regulatory_rules.json")
-        rule.updated_at = datetime.utcnow().isoformat()
+        rule.updated_at = now_iso()
         rule_dict = rule.model_dump()
         
         existing_idx = next(
@@ -450,7 +464,7 @@ class AdvisorStorage:
         from datetime import timedelta
         week_from_now = (datetime.utcnow() + timedelta(days=7)).isoformat()
         upcoming_appts = [a for a in appointments 
-                         if a.scheduled_at >= datetime.utcnow().isoformat() 
+                         if a.scheduled_at >= now_iso() 
                          and a.scheduled_at <= week_from_now]
         
         return {
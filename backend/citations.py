@@ -0,0 +1,90 @@
+"""
+Regulatory rule citations in advisor chat replies.
+
+The advisor agent cites rules inline as [REF:rule-id]; these helpers resolve
+those markers against data/regulatory_rules.json.
+"""
+
+import json
+import re
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+
+def _load_regulatory_rules_map() -> Dict[str, Dict]:
+    """Load regulatory rules into a dict keyed by rule ID for citation lookup."""
+    try:
+        with open(Path(__file__).parent / "data" / "regulatory_rules.json", "r") as f:
+            rules = json.load(f)
+        return {r["id"]: r for r in rules}
+    except Exception:
+        return {}
+
+
+CITATION_PATTERN = re.compile(r'\[REF:([a-zA-Z0-9_-]+)\]')
+
+# Longest partial [REF:...] marker carried across streamed chunk boundaries
+MAX_CITATION_TOKEN_LEN = 128
+
+
+def _build_citation(rule_id: str, rule: Dict[str, Any]) -> Dict[str, Any]:
+    """Shape a regulatory rule into the citation payload sent to the frontend."""
+    return {
+        "id": rule_id,
+        "title": rule.get("title", rule_id),
+        "source": rule.get("source_url", ""),
+        "description": rule.get("description", ""),
+        "jurisdiction": rule.get("jurisdiction", ""),
+        "category": rule.get("category", ""),
+        "values": rule.get("current_values", {}),
+        "last_verified": rule.get("last_verified", ""),
+    }
+
+
+def extract_citations(text: str) -> tuple:
+    """Extract [REF:rule-id] citations from LLM output.
+    Returns (clean_text, citations_list) where citations have title, source, rule_id, description.
+    """
+    rules_map = _load_regulatory_rules_map()
+    found_ids = list(dict.fromkeys(CITATION_PATTERN.findall(text)))  # unique, ordered
+
+    citations = []
+    for rule_id in found_ids:
+        rule = rules_map.get(rule_id)
+        if rule:
+            citations.append(_build_citation(rule_id, rule))
+
+    return text, citations
+
+
+class StreamingCitationExtractor:
+    """Incrementally extract [REF:rule-id] citations from streamed text.
+
+    Only a short tail of unmatched text is kept between chunks, so markers
+    split across chunk boundaries are still found without rescanning the
+    whole response at the end.
+    """
+
+    def __init__(self, rules_map: Optional[Dict[str, Dict]] = None):
+        self.rules_map = _load_regulatory_rules_map() if rules_map is None else rules_map
+        self.citations: List[Dict[str, Any]] = []
+        self._seen_ids: set = set()
+        self._tail = ""
+
+    def feed(self, chunk: str) -> List[Dict[str, Any]]:
+        """Scan a new chunk and return citations first seen in it."""
+        window = self._tail + chunk
+        new_citations = []
+        last_end = 0
+        for match in CITATION_PATTERN.finditer(window):
+            last_end = match.end()
+            rule_id = match.group(1)
+            if rule_id in self._seen_ids:
+                continue
+            self._seen_ids.add(rule_id)
+            rule = self.rules_map.get(rule_id)
+            if rule:
+                new_citations.append(_build_citation(rule_id, rule))
+        self._tail = window[last_end:][-MAX_CITATION_TOKEN_LEN:]
+        self.citations.extend(new_citations)
+        return new_citations
@@ -0,0 +1,45 @@
+"""
+ID and timestamp defaults for stored entities.
+"""
+
+import os
+import time
+import uuid
+from typing import Tuple
+
+
+def _uuid7() -> uuid.UUID:
+    """RFC 9562 version-7 UUID: 48-bit Unix millisecond timestamp followed by random bits."""
+    value = (time.time_ns() // 1_000_000 & 0xFFFF_FFFF_FFFF) << 80
+    value |= int.from_bytes(os.urandom(10), "big")
+    value = value & ~(0xF << 76) | (0x7 << 76)  # version 7
+    value = value & ~(0x3 << 62) | (0x2 << 62)  # RFC 4122 variant
+    return uuid.UUID(int=value)
+
+
+# Python 3.14+ ships uuid.uuid7
+uuid7 = getattr(uuid, "uuid7", _uuid7)
+
+
+def new_id() -> str:
+    """New entity ID. Sorts in creation order (to the millisecond), unlike uuid4."""
+    return str(uuid7())
+
+
+# (unix second, "YYYY-MM-DDTHH:MM:SS") of the most recent now_iso() call
+_last_second: Tuple[int, str] = (-1, "")
+
+
+def now_iso() -> str:
+    """Current UTC time in ``datetime.utcnow().isoformat()`` form (always with microseconds).
+
+    The date/time prefix is formatted once per second and reused, so most
+    calls only format the microseconds.
+    """
+    global _last_second
+    secs, ns = divmod(time.time_ns(), 1_000_000_000)
+    cached_secs, prefix = _last_second
+    if cached_secs != secs:
+        prefix = time.strftime("%Y-%m-%dT%H:%M:%S", time.gmtime(secs))
+        _last_second = (secs, prefix)
+    return f"{prefix}.{ns // 1000:06d}"
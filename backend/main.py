@@ -7,22 +7,27 @@ Enhanced with streaming responses and real-time status updates
 import os
 import json
 import time
+import hashlib
 import asyncio
-import uuid
-from typing import Any, List, Dict, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from typing import Any, FrozenSet, List, Dict, Optional, Tuple
 from datetime import datetime
 from pathlib import Path
 
+import orjson
 from dotenv import load_dotenv
-from fastapi import FastAPI, HTTPException
+from fastapi import FastAPI, HTTPException, Query
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import StreamingResponse
+from fastapi.responses import JSONResponse, Response, StreamingResponse
 from pydantic import BaseModel, Field, ValidationError
 import uvicorn
 
 # Storage imports
 from storage import (
-    storage,
+    get_storage,
+    DEFAULT_PAGE_SIZE,
     Conversation,
     ConversationMessage,
     SavedScenario,
@@ -85,6 +90,16 @@ ENABLE_EVALUATIONS = True  # Enable for agent evaluation feature
 # Data directory path
 DATA_DIR = Path(__file__).parent / "data"
 
+# Expected number of concurrent agent runs (chat streams, briefs, projections)
+AGENT_STREAM_WORKERS = int(os.environ.get("AGENT_STREAM_WORKERS", "8"))
+
+# Optional Redis cache for the advisor shared-scenarios view (needs the `cache` extra)
+REDIS_URL = os.environ.get("REDIS_URL", "")
+SHARED_SCENARIOS_CACHE_TTL = int(os.environ.get("SHARED_SCENARIOS_CACHE_TTL", "300"))
+
+# Upper bound for ?limit= on paginated list endpoints
+MAX_PAGE_SIZE = 200
+
 # Initialize Azure AI client
 credential = DefaultAzureCredential()
 agents_client = AgentsClient(
@@ -92,6 +107,22 @@ agents_client = AgentsClient(
   credential=credential,
 )
 
+# Agent run streams are drained on this pool; each worker thread lazily gets
+# its own AgentsClient so concurrent runs don't share one HTTP pipeline.
+_agent_stream_executor = ThreadPoolExecutor(
+  max_workers=AGENT_STREAM_WORKERS,
+  thread_name_prefix="agent-stream",
+)
+_thread_clients = threading.local()
+
+def _get_thread_agents_client() -> AgentsClient:
+  """Return the AgentsClient owned by the calling worker thread."""
+  client = getattr(_thread_clients, "client", None)
+  if client is None:
+      client = AgentsClient(endpoint=project_endpoint, credential=credential)
+      _thread_clients.client = client
+  return client
+
 # Load data from JSON files
 def load_user_profiles():
   """Load user profiles from JSON file"""
@@ -489,20 +520,35 @@ class ThreadManager:
           self.threads[session_id] = thread.id
       return self.threads[session_id]
 
+# Progress messages keyed by run status and by (step type, step status);
+# looked up once per event instead of walking an if/elif chain
+_RUN_STATUS_MESSAGES = {
+    "in_progress": "Analyzing your financial situation...",
+    "requires_action": "Fetching investment data...",
+    "completed": "Generating personalized recommendations...",
+}
+_RUN_STEP_STATUS_MESSAGES = {
+    ("tool_calls", "in_progress"): "Calculating retirement projections...",
+    ("message_creation", "in_progress"): "Finalizing your personalized plan...",
+    ("message_creation", "completed"): "Analysis complete - preparing results...",
+}
+
 # Streaming Event Handler
 class StreamingRetirementEventHandler(AgentEventHandler):
   def __init__(self, functions: FunctionTool):
       super().__init__()
       self.functions = functions
-      self._accumulated_text = ""
+      self._text_parts: List[str] = []
       self.status_queue = asyncio.Queue()
       self.current_status = "Starting analysis..."
       self.is_complete = False
       self.run_id = None  # Capture run ID for evaluations
+      # Callbacks fire on the executor thread draining the run stream
+      self._loop = asyncio.get_running_loop()
 
-  async def emit_status(self, status: str):
-      """Emit a status update"""
-      await self.status_queue.put({
+  def emit_status(self, status: str):
+      """Emit a status update (safe to call from the stream worker thread)"""
+      self._loop.call_soon_threadsafe(self.status_queue.put_nowait, {
           "type": "status",
           "data": {"status": status},
           "timestamp": time.time()
@@ -512,7 +558,7 @@ class StreamingRetirementEventHandler(AgentEventHandler):
       if delta.delta.content:
           for chunk in delta.delta.content:
               partial_text = chunk.text.get("value", "")
-              self._accumulated_text += partial_text
+              self._text_parts.append(partial_text)
               # Don't stream JSON content character by character
               # Just accumulate it for final processing
 
@@ -521,14 +567,12 @@ class StreamingRetirementEventHandler(AgentEventHandler):
       if not self.run_id:
           self.run_id = run.id
           
-      if run.status == "in_progress":
-          asyncio.create_task(self.emit_status("Analyzing your financial situation..."))
-      elif run.status == "requires_action":
-          asyncio.create_task(self.emit_status("Fetching investment data..."))
-      elif run.status == "completed":
-          asyncio.create_task(self.emit_status("Generating personalized recommendations..."))
-      elif run.status == "failed":
-          asyncio.create_task(self.emit_status(f"Analysis failed: {run.last_error}"))
+      if run.status == "failed":
+          self.emit_status(f"Analysis failed: {run.last_error}")
+      else:
+          status = _RUN_STATUS_MESSAGES.get(run.status)
+          if status:
+              self.emit_status(status)
 
       if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
           tool_calls = run.required_action.submit_tool_outputs.tool_calls
@@ -536,7 +580,7 @@ class StreamingRetirementEventHandler(AgentEventHandler):
           
           for tool_call in tool_calls:
               if tool_call.function.name == "get_product_catalogue":
-                  asyncio.create_task(self.emit_status("Looking up investment products..."))
+                  self.emit_status("Looking up investment products...")
                   args = json.loads(tool_call.function.arguments) if tool_call.function.arguments else {}
                   risk = args.get("risk", "medium")
                   result = get_product_catalogue(risk)
@@ -547,7 +591,7 @@ class StreamingRetirementEventHandler(AgentEventHandler):
                   ))
 
           if tool_outputs:
-              agents_client.runs.submit_tool_outputs_stream(
+              _get_thread_agents_client().runs.submit_tool_outputs_stream(
                   thread_id=run.thread_id,
                   run_id=run.id,
                   tool_outputs=tool_outputs,
@@ -555,19 +599,13 @@ class StreamingRetirementEventHandler(AgentEventHandler):
               )
 
   def on_run_step(self, step: RunStep) -> None:
-      step_type = step.type
-      step_status = step.status
-      
-      if step_type == "tool_calls" and step_status == "in_progress":
-          asyncio.create_task(self.emit_status("Calculating retirement projections..."))
-      elif step_type == "message_creation" and step_status == "in_progress":
-          asyncio.create_task(self.emit_status("Finalizing your personalized plan..."))
-      elif step_type == "message_creation" and step_status == "completed":
-          asyncio.create_task(self.emit_status("Analysis complete - preparing results..."))
+      status = _RUN_STEP_STATUS_MESSAGES.get((step.type, step.status))
+      if status:
+          self.emit_status(status)
 
   def on_done(self) -> None:
       self.is_complete = True
-      asyncio.create_task(self.emit_status("Finalizing analysis..."))
+      self.emit_status("Finalizing analysis...")
 
 # Initialize components
 user_functions = {get_product_catalogue}
@@ -611,6 +649,31 @@ def setup_agent():
 # Initialize agent
 agent, functions = setup_agent()
 
+
+_SSE_PRE = b"data: "
+_SSE_POST = b"\n\n"
+
+
+def _sse_frame(payload: Dict[str, Any]) -> bytes:
+  """Encode a single server-sent event frame as bytes for StreamingResponse."""
+  return _SSE_PRE + orjson.dumps(payload, option=orjson.OPT_NON_STR_KEYS) + _SSE_POST
+
+
+def _drain_run_stream(thread_id: str, agent_id: str, event_handler: AgentEventHandler) -> None:
+  """Consume a synchronous agent run stream to completion.
+
+  The SDK iterator blocks on network reads, so callers run this on
+  ``_agent_stream_executor``; the event handler callbacks fire here too and
+  share the worker's client.
+  """
+  with _get_thread_agents_client().runs.stream(
+      thread_id=thread_id,
+      agent_id=agent_id,
+      event_handler=event_handler
+  ) as stream:
+      for _ in stream:
+          pass
+
 # Evaluation Configuration
 def setup_evaluators():
     """Setup AI evaluators for agent performance"""
@@ -747,8 +810,19 @@ async def evaluate_agent_run(thread_id: str, run_id: str) -> Optional[Dict[str,
         print(f"Evaluation failed for run {run_id}: {e}")
         return {"error": f"Evaluation failed: {str(e)}"}
 
+class OrjsonResponse(JSONResponse):
+    """JSON response rendered straight to bytes with orjson instead of stdlib json."""
+
+    def render(self, content: Any) -> bytes:
+        return orjson.dumps(content, option=orjson.OPT_NON_STR_KEYS)
+
+
 # FastAPI app
-app = FastAPI(title="Retirement Planning API", version="1.0.0")
+app = FastAPI(
+    title="Retirement Planning API",
+    version="1.0.0",
+    default_response_class=OrjsonResponse,
+)
 
 # Include advisor and admin routers
 from advisor_routes import router as advisor_router
@@ -783,6 +857,8 @@ async def get_profiles():
 
 # Import advisor storage for data enrichment
 from advisor_storage import advisor_storage as _advisor_store
+from citations import StreamingCitationExtractor, extract_citations
+from ids import new_id, now_iso
 from models import EscalationTicket, EscalationReason, EscalationPriority
 
 ADVISOR_SYSTEM_PROMPT = """You are Sage, an AI assistant for financial advisors. You help advisors manage their practice, 
@@ -869,6 +945,62 @@ Only use [REF:id] for rules that exist in the Regulatory Reference Data — neve
 """
 
 
+def _mtime_ns(path: Path) -> int:
+    try:
+        return path.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=16)
+def _reference_summaries(jurisdictions: Tuple[str, ...], rules_mtime: int, products_mtime: int) -> Tuple[str, str]:
+    """Format the regulatory and product sections of the advisor prompt.
+
+    Both come from data files that rarely change, so the text is cached per
+    jurisdiction set; the file mtimes are part of the key so admin edits to
+    the rules show up on the next request.
+    """
+    regulatory_summaries = "No regulatory data available."
+    try:
+        with open(DATA_DIR / "regulatory_rules.json", "r") as f:
+            all_rules = json.load(f)
+        # Filter to active rules for advisor's jurisdictions
+        relevant_rules = [r for r in all_rules if r.get("is_active", True) and r.get("jurisdiction") in jurisdictions]
+        rule_lines = []
+        for r in relevant_rules:
+            vals = r.get("current_values", {})
+            vals_str = ", ".join(f"{k}: {v}" for k, v in vals.items())
+            source = r.get("source_url", "")
+            rule_lines.append(
+                f"- **[{r['id']}]** {r['title']} ({r['jurisdiction']}, {r['category']}): {r['description']}\n"
+                f"  Values: {vals_str}\n"
+                f"  Source: {source}\n"
+                f"  Last verified: {r.get('last_verified', 'N/A')}"
+            )
+        regulatory_summaries = "\n".join(rule_lines) if rule_lines else "No regulatory rules for advisor's jurisdictions."
+    except Exception as e:
+        print(f"Warning: Could not load regulatory rules: {e}")
+
+    # Load investment products
+    product_summaries = "No product data available."
+    try:
+        with open(DATA_DIR / "investment_products.json", "r") as f:
+            products_data = json.load(f)
+        product_lines = []
+        for risk_level, products in products_data.get("products_by_risk", {}).items():
+            for p in products:
+                product_lines.append(
+                    f"- [{risk_level.upper()}] {p['name']}: {p['description']} "
+                    f"(exp. return: {p['exp_return']*100:.1f}%, expense ratio: {p['expense_ratio']*100:.2f}%, "
+                    f"min investment: ${p['minimum_investment']:,})"
+                )
+        product_summaries = "\n".join(product_lines) if product_lines else "No products in catalog."
+    except Exception as e:
+        print(f"Warning: Could not load investment products: {e}")
+
+    return regulatory_summaries, product_summaries
+
+
 async def _build_advisor_context(advisor_id: str) -> str:
     """Build a rich context string with real advisor/client/escalation/appointment data."""
     from datetime import datetime
@@ -897,6 +1029,7 @@ async def _build_advisor_context(advisor_id: str) -> str:
             f"Target: retire at {c.target_retire_age}, ${c.target_monthly_income:,.0f}/mo income"
         )
     client_summaries = "\n".join(client_lines) if client_lines else "No clients assigned."
+    client_names = {c.id: c.name for c in clients}
 
     # Escalations
     escalations = await _advisor_store.get_escalations_for_advisor(advisor_id)
@@ -904,12 +1037,7 @@ async def _build_advisor_context(advisor_id: str) -> str:
     for e in escalations:
         status = e.status.value if hasattr(e.status, 'value') else str(e.status)
         priority = e.priority.value if hasattr(e.priority, 'value') else str(e.priority)
-        # Find client name
-        client_name = e.client_id
-        for c in clients:
-            if c.id == e.client_id:
-                client_name = c.name
-                break
+        client_name = client_names.get(e.client_id, e.client_id)
         esc_lines.append(
             f"- [{priority.upper()}] {client_name}: \"{e.client_question}\" (status: {status}, created: {e.created_at[:10]})"
         )
@@ -921,12 +1049,7 @@ async def _build_advisor_context(advisor_id: str) -> str:
     for a in appointments:
         status = a.status.value if hasattr(a.status, 'value') else str(a.status)
         meeting_type = a.meeting_type.value if hasattr(a.meeting_type, 'value') else str(a.meeting_type)
-        # Find client name
-        client_name = a.client_id
-        for c in clients:
-            if c.id == a.client_id:
-                client_name = c.name
-                break
+        client_name = client_names.get(a.client_id, a.client_id)
         is_today = a.scheduled_at[:10] == today
         day_label = "TODAY" if is_today else a.scheduled_at[:10]
         appt_lines.append(
@@ -935,46 +1058,11 @@ async def _build_advisor_context(advisor_id: str) -> str:
         )
     appointment_summaries = "\n".join(appt_lines) if appt_lines else "No upcoming appointments."
 
-    # Load regulatory rules
-    import os
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
-    regulatory_summaries = "No regulatory data available."
-    try:
-        with open(os.path.join(data_dir, "regulatory_rules.json"), "r") as f:
-            all_rules = json.load(f)
-        # Filter to active rules for advisor's jurisdictions
-        relevant_rules = [r for r in all_rules if r.get("is_active", True) and r.get("jurisdiction") in advisor_jurisdictions_list]
-        rule_lines = []
-        for r in relevant_rules:
-            vals = r.get("current_values", {})
-            vals_str = ", ".join(f"{k}: {v}" for k, v in vals.items())
-            source = r.get("source_url", "")
-            rule_lines.append(
-                f"- **[{r['id']}]** {r['title']} ({r['jurisdiction']}, {r['category']}): {r['description']}\n"
-                f"  Values: {vals_str}\n"
-                f"  Source: {source}\n"
-                f"  Last verified: {r.get('last_verified', 'N/A')}"
-            )
-        regulatory_summaries = "\n".join(rule_lines) if rule_lines else "No regulatory rules for advisor's jurisdictions."
-    except Exception as e:
-        print(f"Warning: Could not load regulatory rules: {e}")
-
-    # Load investment products
-    product_summaries = "No product data available."
-    try:
-        with open(os.path.join(data_dir, "investment_products.json"), "r") as f:
-            products_data = json.load(f)
-        product_lines = []
-        for risk_level, products in products_data.get("products_by_risk", {}).items():
-            for p in products:
-                product_lines.append(
-                    f"- [{risk_level.upper()}] {p['name']}: {p['description']} "
-                    f"(exp. return: {p['exp_return']*100:.1f}%, expense ratio: {p['expense_ratio']*100:.2f}%, "
-                    f"min investment: ${p['minimum_investment']:,})"
-                )
-        product_summaries = "\n".join(product_lines) if product_lines else "No products in catalog."
-    except Exception as e:
-        print(f"Warning: Could not load investment products: {e}")
+    regulatory_summaries, product_summaries = _reference_summaries(
+        tuple(advisor_jurisdictions_list),
+        _mtime_ns(DATA_DIR / "regulatory_rules.json"),
+        _mtime_ns(DATA_DIR / "investment_products.json"),
+    )
 
     return ADVISOR_SYSTEM_PROMPT.format(
         today=today,
@@ -1086,12 +1174,16 @@ async def generate_pre_meeting_brief_endpoint(request: PreMeetingBriefRequest):
         class TextHandler(AgentEventHandler):
             def __init__(self):
                 super().__init__()
-                self.text = ""
+                self._parts: List[str] = []
+
+            @property
+            def text(self) -> str:
+                return "".join(self._parts)
 
             def on_message_delta(self, delta: MessageDeltaChunk):
                 if delta.delta.content:
                     for chunk in delta.delta.content:
-                        self.text += chunk.text.get("value", "")
+                        self._parts.append(chunk.text.get("value", ""))
 
             def on_thread_run(self, run: ThreadRun):
                 if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
@@ -1103,17 +1195,15 @@ async def generate_pre_meeting_brief_endpoint(request: PreMeetingBriefRequest):
                             result = get_product_catalogue(args.get("risk", "medium"))
                             tool_outputs.append(ToolOutput(tool_call_id=tc.id, output=result))
                     if tool_outputs:
-                        agents_client.runs.submit_tool_outputs_stream(
+                        _get_thread_agents_client().runs.submit_tool_outputs_stream(
                             thread_id=run.thread_id, run_id=run.id,
                             tool_outputs=tool_outputs, event_handler=self,
                         )
 
         handler = TextHandler()
-        with agents_client.runs.stream(
-            thread_id=thread.id, agent_id=agent.id, event_handler=handler,
-        ) as stream:
-            for _ in stream:
-                pass
+        await asyncio.get_running_loop().run_in_executor(
+            _agent_stream_executor, _drain_run_stream, thread.id, agent.id, handler,
+        )
 
         # Parse the JSON response from the LLM
         raw = handler.text.strip()
@@ -1238,12 +1328,16 @@ async def generate_scenario_analysis_endpoint(request: ScenarioAnalysisRequest):
         class TextHandler(AgentEventHandler):
             def __init__(self):
                 super().__init__()
-                self.text = ""
+                self._parts: List[str] = []
+
+            @property
+            def text(self) -> str:
+                return "".join(self._parts)
 
             def on_message_delta(self, delta: MessageDeltaChunk):
                 if delta.delta.content:
                     for chunk in delta.delta.content:
-                        self.text += chunk.text.get("value", "")
+                        self._parts.append(chunk.text.get("value", ""))
 
             def on_thread_run(self, run: ThreadRun):
                 if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
@@ -1255,17 +1349,15 @@ async def generate_scenario_analysis_endpoint(request: ScenarioAnalysisRequest):
                             result = get_product_catalogue(args.get("risk", "medium"))
                             tool_outputs.append(ToolOutput(tool_call_id=tc.id, output=result))
                     if tool_outputs:
-                        agents_client.runs.submit_tool_outputs_stream(
+                        _get_thread_agents_client().runs.submit_tool_outputs_stream(
                             thread_id=run.thread_id, run_id=run.id,
                             tool_outputs=tool_outputs, event_handler=self,
                         )
 
         handler = TextHandler()
-        with agents_client.runs.stream(
-            thread_id=thread.id, agent_id=agent.id, event_handler=handler,
-        ) as stream:
-            for _ in stream:
-                pass
+        await asyncio.get_running_loop().run_in_executor(
+            _agent_stream_executor, _drain_run_stream, thread.id, agent.id, handler,
+        )
 
         raw = handler.text.strip()
         if raw.startswith("```"):
@@ -1285,45 +1377,6 @@ async def generate_scenario_analysis_endpoint(request: ScenarioAnalysisRequest):
         raise HTTPException(status_code=500, detail=str(e))
 
 
-def _load_regulatory_rules_map() -> Dict[str, Dict]:
-    """Load regulatory rules into a dict keyed by rule ID for citation lookup."""
-    import os
-    data_dir = os.path.join(os.path.dirname(__file__), "data")
-    try:
-        with open(os.path.join(data_dir, "regulatory_rules.json"), "r") as f:
-            rules = json.load(f)
-        return {r["id"]: r for r in rules}
-    except Exception:
-        return {}
-
-
-def _extract_citations(text: str) -> tuple:
-    """Extract [REF:rule-id] citations from LLM output.
-    Returns (clean_text, citations_list) where citations have title, source, rule_id, description.
-    """
-    import re
-    rules_map = _load_regulatory_rules_map()
-    pattern = re.compile(r'\[REF:([a-zA-Z0-9_-]+)\]')
-    found_ids = list(dict.fromkeys(pattern.findall(text)))  # unique, ordered
-
-    citations = []
-    for rule_id in found_ids:
-        rule = rules_map.get(rule_id)
-        if rule:
-            citations.append({
-                "id": rule_id,
-                "title": rule.get("title", rule_id),
-                "source": rule.get("source_url", ""),
-                "description": rule.get("description", ""),
-                "jurisdiction": rule.get("jurisdiction", ""),
-                "category": rule.get("category", ""),
-                "values": rule.get("current_values", {}),
-                "last_verified": rule.get("last_verified", ""),
-            })
-
-    return text, citations
-
-
 @app.post("/advisor/chat")
 async def advisor_chat(request: AdvisorChatRequest):
     """Non-streaming advisor chat with real LLM and enriched context."""
@@ -1344,12 +1397,16 @@ async def advisor_chat(request: AdvisorChatRequest):
         class TextHandler(AgentEventHandler):
             def __init__(self):
                 super().__init__()
-                self.text = ""
+                self._parts: List[str] = []
+
+            @property
+            def text(self) -> str:
+                return "".join(self._parts)
 
             def on_message_delta(self, delta: MessageDeltaChunk):
                 if delta.delta.content:
                     for chunk in delta.delta.content:
-                        self.text += chunk.text.get("value", "")
+                        self._parts.append(chunk.text.get("value", ""))
 
             def on_thread_run(self, run: ThreadRun):
                 if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
@@ -1361,19 +1418,17 @@ async def advisor_chat(request: AdvisorChatRequest):
                             result = get_product_catalogue(args.get("risk", "medium"))
                             tool_outputs.append(ToolOutput(tool_call_id=tc.id, output=result))
                     if tool_outputs:
-                        agents_client.runs.submit_tool_outputs_stream(
+                        _get_thread_agents_client().runs.submit_tool_outputs_stream(
                             thread_id=run.thread_id, run_id=run.id,
                             tool_outputs=tool_outputs, event_handler=self,
                         )
 
         handler = TextHandler()
-        with agents_client.runs.stream(
-            thread_id=thread.id, agent_id=agent.id, event_handler=handler,
-        ) as stream:
-            for _ in stream:
-                pass
+        await asyncio.get_running_loop().run_in_executor(
+            _agent_stream_executor, _drain_run_stream, thread.id, agent.id, handler,
+        )
 
-        clean_text, citations = _extract_citations(handler.text)
+        clean_text, citations = extract_citations(handler.text)
         return {"response": clean_text, "citations": citations}
 
     except Exception as e:
@@ -1409,23 +1464,21 @@ async def advisor_chat_stream(request: AdvisorChatRequest):
         )
 
         async def generate():
-            accumulated = ""
+            accumulated_parts: List[str] = []
+            citation_extractor = StreamingCitationExtractor()
 
             class StreamHandler(AgentEventHandler):
-                def __init__(self):
+                def __init__(self, loop: asyncio.AbstractEventLoop):
                     super().__init__()
+                    self._loop = loop
                     self.chunks = asyncio.Queue()
-                    self.done = False
 
                 def on_message_delta(self, delta: MessageDeltaChunk):
                     if delta.delta.content:
                         for chunk in delta.delta.content:
                             text = chunk.text.get("value", "")
                             if text:
-                                self.chunks.put_nowait(text)
-
-                def on_done(self):
-                    self.done = True
+                                self._loop.call_soon_threadsafe(self.chunks.put_nowait, text)
 
                 def on_thread_run(self, run: ThreadRun):
                     if run.status == "requires_action" and isinstance(run.required_action, SubmitToolOutputsAction):
@@ -1437,41 +1490,44 @@ async def advisor_chat_stream(request: AdvisorChatRequest):
                                 result = get_product_catalogue(args.get("risk", "medium"))
                                 tool_outputs.append(ToolOutput(tool_call_id=tc.id, output=result))
                         if tool_outputs:
-                            agents_client.runs.submit_tool_outputs_stream(
+                            _get_thread_agents_client().runs.submit_tool_outputs_stream(
                                 thread_id=run.thread_id, run_id=run.id,
                                 tool_outputs=tool_outputs, event_handler=self,
                             )
 
-            handler = StreamHandler()
-
-            async def run_agent():
-                with agents_client.runs.stream(
-                    thread_id=thread.id, agent_id=agent.id, event_handler=handler,
-                ) as stream:
-                    for _ in stream:
-                        await asyncio.sleep(0.01)
-                handler.done = True
-
-            task = asyncio.create_task(run_agent())
-
-            while not handler.done or not handler.chunks.empty():
-                try:
-                    chunk = await asyncio.wait_for(handler.chunks.get(), timeout=0.1)
-                    accumulated += chunk
-                    yield f"data: {json.dumps({'type': 'content', 'data': chunk})}\n\n"
-                except asyncio.TimeoutError:
-                    if task.done():
-                        # Drain remaining chunks
-                        while not handler.chunks.empty():
-                            chunk = handler.chunks.get_nowait()
-                            accumulated += chunk
-                            yield f"data: {json.dumps({'type': 'content', 'data': chunk})}\n\n"
-                        break
+            loop = asyncio.get_running_loop()
+            handler = StreamHandler(loop)
+
+            task = loop.run_in_executor(
+                _agent_stream_executor, _drain_run_stream, thread.id, agent.id, handler,
+            )
+            # Chunk puts are scheduled before the future resolves, so the
+            # sentinel always lands after the last chunk.
+            task.add_done_callback(lambda _: handler.chunks.put_nowait(None))
+
+            done = False
+            while not done:
+                # Coalesce deltas that queued up while the last frame was
+                # being written into a single content frame
+                pending = [await handler.chunks.get()]
+                while not handler.chunks.empty():
+                    pending.append(handler.chunks.get_nowait())
+                if pending[-1] is None:
+                    pending.pop()
+                    done = True
+                if not pending:
+                    break
+                chunk = "".join(pending)
+                accumulated_parts.append(chunk)
+                yield _sse_frame({'type': 'content', 'data': chunk})
+                for citation in citation_extractor.feed(chunk):
+                    yield _sse_frame({'type': 'citation', 'data': citation})
 
             await task
 
-            clean_text, citations = _extract_citations(accumulated)
-            yield f"data: {json.dumps({'type': 'complete', 'data': {'response': clean_text, 'citations': citations}})}\n\n"
+            # Citations were already streamed; the final event just echoes them
+            accumulated = "".join(accumulated_parts)
+            yield _sse_frame({'type': 'complete', 'data': {'response': accumulated, 'citations': citation_extractor.citations}})
 
         return StreamingResponse(
             generate(),
@@ -1529,40 +1585,33 @@ async def chat_stream(request: ChatRequest):
           response_text = ""
           analysis_data = None
           
-          # Start the streaming run
-          with agents_client.runs.stream(
-              thread_id=thread_id,
-              agent_id=agent.id,
-              event_handler=event_handler
-          ) as stream:
-              
-              # Process events in a separate task
-              async def process_events():
-                  for event in stream:
-                      await asyncio.sleep(0.01)  # Small delay to allow queue processing
-              
-              # Start processing events
-              event_task = asyncio.create_task(process_events())
-              
-              # Stream status updates only (no content streaming)
-              while not event_handler.is_complete:
-                  try:
-                      # Check for status updates
-                      status_update = await asyncio.wait_for(
-                          event_handler.status_queue.get(), timeout=0.1
-                      )
-                      yield f"data: {json.dumps(status_update)}\n\n"
-                  except asyncio.TimeoutError:
-                      pass
-                  
-                  if event_task.done():
+          # Drain the run stream on a worker thread
+          loop = asyncio.get_running_loop()
+          event_task = loop.run_in_executor(
+              _agent_stream_executor, _drain_run_stream, thread_id, agent.id, event_handler
+          )
+          event_task.add_done_callback(lambda _: event_handler.status_queue.put_nowait(None))
+          
+          # Stream status updates only (no content streaming). When several
+          # are already queued, only the latest is worth a frame.
+          done = False
+          while not done:
+              status_update = await event_handler.status_queue.get()
+              while status_update is not None and not event_handler.status_queue.empty():
+                  queued = event_handler.status_queue.get_nowait()
+                  if queued is None:
+                      done = True
                       break
-              
-              # Wait for event processing to complete
-              await event_task
+                  status_update = queued
+              if status_update is None:
+                  break
+              yield _sse_frame(status_update)
+          
+          # Wait for event processing to complete
+          await event_task
           
           # Process the complete response
-          response_text = event_handler._accumulated_text
+          response_text = "".join(event_handler._text_parts)
           
           # Send status update for JSON parsing
           parsing_status = {
@@ -1570,7 +1619,7 @@ async def chat_stream(request: ChatRequest):
               "data": {"status": "Processing analysis results..."},
               "timestamp": time.time()
           }
-          yield f"data: {json.dumps(parsing_status)}\n\n"
+          yield _sse_frame(parsing_status)
           
           # Try to parse analysis from response
           try:
@@ -1616,7 +1665,7 @@ async def chat_stream(request: ChatRequest):
                       "data": {"analysis": analysis_data.model_dump()},
                       "timestamp": time.time()
                   }
-                  yield f"data: {json.dumps(analysis_update)}\n\n"
+                  yield _sse_frame(analysis_update)
               else:
                   # Try parsing the entire response as JSON
                   try:
@@ -1639,7 +1688,7 @@ async def chat_stream(request: ChatRequest):
                           "data": {"analysis": analysis_data.dict()},
                           "timestamp": time.time()
                       }
-                      yield f"data: {json.dumps(analysis_update)}\n\n"
+                      yield _sse_frame(analysis_update)
                   except Exception as fallback_error:
                       print(f"Fallback JSON parsing also failed: {fallback_error}")
                       # If all JSON parsing fails, send an error status
@@ -1648,7 +1697,7 @@ async def chat_stream(request: ChatRequest):
                           "data": {"status": "The AI response format is invalid. Please try a different question."},
                           "timestamp": time.time()
                       }
-                      yield f"data: {json.dumps(error_status)}\n\n"
+                      yield _sse_frame(error_status)
                       
           except (json.JSONDecodeError, ValidationError) as e:
               print(f"Could not parse analysis JSON: {e}")
@@ -1668,7 +1717,7 @@ async def chat_stream(request: ChatRequest):
                   "data": {"status": f"Analysis parsing failed: {error_msg}. Please try again."},
                   "timestamp": time.time()
               }
-              yield f"data: {json.dumps(error_status)}\n\n"
+              yield _sse_frame(error_status)
               
               # Set analysis_data to None so we don't send invalid data
               analysis_data = None
@@ -1687,7 +1736,7 @@ async def chat_stream(request: ChatRequest):
               },
               "timestamp": time.time()
           }
-          yield f"data: {json.dumps(final_response)}\n\n"
+          yield _sse_frame(final_response)
       
       return StreamingResponse(
           generate_stream(),
@@ -1729,12 +1778,16 @@ async def chat_endpoint(request: ChatRequest):
       class ResponseHandler(AgentEventHandler):
           def __init__(self):
               super().__init__()
-              self.response = ""
+              self._parts: List[str] = []
+          
+          @property
+          def response(self) -> str:
+              return "".join(self._parts)
           
           def on_message_delta(self, delta: MessageDeltaChunk):
               if delta.delta.content:
                   for chunk in delta.delta.content:
-                      self.response += chunk.text.get("value", "")
+                      self._parts.append(chunk.text.get("value", ""))
           
           def on_thread_run(self, run: ThreadRun):
               if run.status == "completed":
@@ -1756,7 +1809,7 @@ async def chat_endpoint(request: ChatRequest):
                           ))
                   
                   if tool_outputs:
-                      agents_client.runs.submit_tool_outputs_stream(
+                      _get_thread_agents_client().runs.submit_tool_outputs_stream(
                           thread_id=run.thread_id,
                           run_id=run.id,
                           tool_outputs=tool_outputs,
@@ -1765,13 +1818,9 @@ async def chat_endpoint(request: ChatRequest):
       
       handler = ResponseHandler()
       
-      with agents_client.runs.stream(
-          thread_id=thread_id,
-          agent_id=agent.id,
-          event_handler=handler
-      ) as stream:
-          for event in stream:
-              pass
+      await asyncio.get_running_loop().run_in_executor(
+          _agent_stream_executor, _drain_run_stream, thread_id, agent.id, handler
+      )
       
       response_text = handler.response
       
@@ -2022,25 +2071,25 @@ async def project_scenario(request: ScenarioProjectionRequest):
         class ProjectionHandler(AgentEventHandler):
             def __init__(self):
                 super().__init__()
-                self.response = ""
+                self._parts: List[str] = []
+            
+            @property
+            def response(self) -> str:
+                return "".join(self._parts)
             
             def on_message_delta(self, delta: MessageDeltaChunk):
                 if delta.delta.content:
                     for chunk in delta.delta.content:
-                        self.response += chunk.text.get("value", "")
+                        self._parts.append(chunk.text.get("value", ""))
             
             def on_thread_run(self, run: ThreadRun):
                 pass  # No tool calls needed for projections
         
         handler = ProjectionHandler()
         
-        with agents_client.runs.stream(
-            thread_id=thread.id,
-            agent_id=agent.id,
-            event_handler=handler
-        ) as stream:
-            for event in stream:
-                pass
+        await asyncio.get_running_loop().run_in_executor(
+            _agent_stream_executor, _drain_run_stream, thread.id, agent.id, handler
+        )
         
         response_text = handler.response.strip()
         
@@ -2101,18 +2150,18 @@ class AddMessageRequest(BaseModel):
 
 
 @app.get("/api/conversations/{user_id}")
-async def list_user_conversations(user_id: str):
-    """List all conversations for a user."""
-    conversations = await storage.list_conversations(user_id)
+async def list_user_conversations(user_id: str, limit: Optional[int] = Query(None, ge=1, le=MAX_PAGE_SIZE)):
+    """List a user's conversations, most recently updated first (all of them unless ``limit`` is set)."""
+    conversations = await get_storage().list_conversation_summaries(user_id, limit=limit)
     return {
         "conversations": [
             {
                 "id": c.id,
                 "title": c.title,
-                "message_count": len(c.messages),
+                "message_count": c.message_count,
                 "created_at": c.created_at,
                 "updated_at": c.updated_at,
-                "preview": c.messages[-1].content[:100] if c.messages else ""
+                "preview": c.last_message.content[:100] if c.last_message else ""
             }
             for c in conversations
         ]
@@ -2122,20 +2171,21 @@ async def list_user_conversations(user_id: str):
 @app.get("/api/conversations/{user_id}/{conversation_id}")
 async def get_conversation(user_id: str, conversation_id: str):
     """Get a specific conversation with all messages."""
-    conversation = await storage.get_conversation(user_id, conversation_id)
+    conversation = await get_storage().get_conversation(user_id, conversation_id)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
-    return conversation.model_dump()
+    return conversation.model_dump(mode="json")
 
 
 @app.post("/api/conversations/{user_id}")
 async def create_conversation(user_id: str, request: SaveConversationRequest):
     """Create a new conversation."""
+    now = now_iso()
     messages = [
         ConversationMessage(
             role=m.get("role", "user"),
             content=m.get("content", ""),
-            timestamp=m.get("timestamp", datetime.utcnow().isoformat())
+            timestamp=m.get("timestamp", now)
         )
         for m in request.messages
     ]
@@ -2146,23 +2196,24 @@ async def create_conversation(user_id: str, request: SaveConversationRequest):
         messages=messages
     )
     
-    conversation_id = await storage.save_conversation(conversation)
+    conversation_id = await get_storage().save_conversation(conversation)
     return {"id": conversation_id, "message": "Conversation created"}
 
 
 @app.put("/api/conversations/{user_id}/{conversation_id}")
 async def update_conversation(user_id: str, conversation_id: str, request: SaveConversationRequest):
     """Update an existing conversation."""
-    existing = await storage.get_conversation(user_id, conversation_id)
+    existing = await get_storage().get_conversation(user_id, conversation_id)
     if not existing:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
+    now = now_iso()
     messages = [
         ConversationMessage(
-            id=m.get("id", str(uuid.uuid4()) if 'uuid' in dir() else ""),
+            id=m.get("id") or new_id(),
             role=m.get("role", "user"),
             content=m.get("content", ""),
-            timestamp=m.get("timestamp", datetime.utcnow().isoformat())
+            timestamp=m.get("timestamp", now)
         )
         for m in request.messages
     ]
@@ -2170,14 +2221,14 @@ async def update_conversation(user_id: str, conversation_id: str, request: SaveC
     existing.title = request.title
     existing.messages = messages
     
-    await storage.save_conversation(existing)
+    await get_storage().save_conversation(existing)
     return {"id": conversation_id, "message": "Conversation updated"}
 
 
 @app.post("/api/conversations/{user_id}/{conversation_id}/messages")
 async def add_message_to_conversation(user_id: str, conversation_id: str, request: AddMessageRequest):
     """Add a message to an existing conversation."""
-    conversation = await storage.get_conversation(user_id, conversation_id)
+    conversation = await get_storage().get_conversation(user_id, conversation_id)
     if not conversation:
         raise HTTPException(status_code=404, detail="Conversation not found")
     
@@ -2187,14 +2238,14 @@ async def add_message_to_conversation(user_id: str, conversation_id: str, reques
     )
     conversation.messages.append(message)
     
-    await storage.save_conversation(conversation)
+    await get_storage().save_conversation(conversation)
     return {"message_id": message.id, "message": "Message added"}
 
 
 @app.delete("/api/conversations/{user_id}/{conversation_id}")
 async def delete_conversation(user_id: str, conversation_id: str):
     """Delete a conversation."""
-    success = await storage.delete_conversation(user_id, conversation_id)
+    success = await get_storage().delete_conversation(user_id, conversation_id)
     if not success:
         raise HTTPException(status_code=404, detail="Conversation not found")
     return {"message": "Conversation deleted"}
@@ -2219,46 +2270,211 @@ class ScenarioConsentRequest(BaseModel):
 
 
 def _resolve_advisor_id_for_user(user_id: str, fallback_advisor_id: Optional[str] = None) -> Optional[str]:
-    """Resolve advisor_id from user profile JSON with optional fallback."""
-    if fallback_advisor_id:
-        return fallback_advisor_id
-    try:
-        with open(DATA_DIR / "user_profiles.json", "r", encoding="utf-8") as f:
-            profiles = json.load(f)
-        for profile in profiles:
-            if profile.get("id") == user_id:
-                return profile.get("advisor_id")
-    except Exception:
-        pass
-    return None
+    """Resolve advisor_id from the request, else the client's stored assignment."""
+    return fallback_advisor_id or _advisor_store.get_client_advisor_id(user_id)
+
+
+class SharedScenariosCache:
+    """Redis cache-aside for the advisor shared-scenarios view.
+
+    Each (advisor, client) pair is one Redis hash holding the serialized
+    response body per page. The whole hash is deleted when a consent write for
+    that pair commits; the TTL is only a backstop. Without ``REDIS_URL`` (or the redis package) every call is a
+    no-op, and Redis errors are logged and treated as cache misses.
+
+    A reader that misses, reads storage and then stores its page could race a
+    consent commit and re-cache the pre-commit body. Each pair therefore has a
+    generation counter that ``invalidate`` bumps; ``get`` returns the
+    generation it saw and ``set`` only stores the page if it is still current.
+    """
+
+    # Generation counters outlive any single request by a wide margin
+    GENERATION_TTL_S = 24 * 3600
+
+    _SET_IF_CURRENT = """
+    if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then return 0 end
+    redis.call('HSET', KEYS[1], ARGV[2], ARGV[3])
+    redis.call('EXPIRE', KEYS[1], ARGV[4])
+    return 1
+    """
+
+    def __init__(self, url: str, ttl_s: int):
+        self.ttl_s = ttl_s
+        self._client = None
+        if url:
+            try:
+                import redis.asyncio as aioredis
+            except ImportError:
+                print("REDIS_URL is set but redis is not installed; shared-scenarios cache disabled")
+            else:
+                self._client = aioredis.from_url(url)
+                self._set_if_current = self._client.register_script(self._SET_IF_CURRENT)
+
+    @staticmethod
+    def key(advisor_id: str, client_id: str) -> str:
+        return f"sage:shared-scenarios:{advisor_id}:{client_id}"
+
+    @staticmethod
+    def _generation_key(key: str) -> str:
+        return f"{key}:gen"
+
+    async def get(self, key: str, page: str) -> Tuple[Optional[bytes], bytes]:
+        """Return (cached body or None, generation token to hand back to ``set``)."""
+        if self._client is None:
+            return None, b""
+        try:
+            async with self._client.pipeline(transaction=False) as pipe:
+                pipe.hget(key, page)
+                pipe.get(self._generation_key(key))
+                body, generation = await pipe.execute()
+            return body, generation or b""
+        except Exception as e:
+            print(f"Shared-scenarios cache read failed: {e}")
+            return None, b""
+
+    async def set(self, key: str, page: str, body: bytes, generation: bytes) -> None:
+        if self._client is None:
+            return
+        try:
+            await self._set_if_current(
+                keys=[key, self._generation_key(key)],
+                args=[generation, page, body, self.ttl_s],
+            )
+        except Exception as e:
+            print(f"Shared-scenarios cache write failed: {e}")
+
+    async def invalidate(self, keys: List[str]) -> None:
+        if self._client is None or not keys:
+            return
+        try:
+            async with self._client.pipeline(transaction=True) as pipe:
+                for key in keys:
+                    generation_key = self._generation_key(key)
+                    pipe.incr(generation_key)
+                    pipe.expire(generation_key, self.GENERATION_TTL_S)
+                pipe.delete(*keys)
+                await pipe.execute()
+        except Exception as e:
+            print(f"Shared-scenarios cache invalidation failed: {e}")
+
+
+_shared_scenarios_cache = SharedScenariosCache(REDIS_URL, SHARED_SCENARIOS_CACHE_TTL)
+
+
+class ConsentWriteBatcher:
+    """Single writer task that persists consent escalations and share records in batches.
+
+    Requests enqueue their (escalation, record) pair and await a future. The
+    writer drains up to ``max_batch`` items (or whatever arrives within
+    ``window_s``) and commits them with one escalations-file write and one
+    share-file write per user. The task starts lazily on first use.
+    """
+
+    def __init__(self, max_batch: int = 32, window_s: float = 0.005):
+        self.max_batch = max_batch
+        self.window_s = window_s
+        self._queue: Optional[asyncio.Queue] = None
+        self._task: Optional[asyncio.Task] = None
+
+    def _ensure_started(self) -> None:
+        if self._task is None or self._task.done() or self._task.get_loop() is not asyncio.get_running_loop():
+            self._queue = asyncio.Queue()
+            self._task = asyncio.create_task(self._writer_loop())
+
+    async def submit(self, escalation: Optional[EscalationTicket], record: ScenarioShareRecord) -> str:
+        """Queue one consent write and wait until it is committed. Returns the share record ID."""
+        self._ensure_started()
+        future = asyncio.get_running_loop().create_future()
+        await self._queue.put((escalation, record, future))
+        return await future
+
+    async def _next_batch(self) -> list:
+        batch = [await self._queue.get()]
+        deadline = time.monotonic() + self.window_s
+        while len(batch) < self.max_batch:
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            try:
+                batch.append(await asyncio.wait_for(self._queue.get(), timeout=remaining))
+            except asyncio.TimeoutError:
+                break
+        return batch
+
+    async def _writer_loop(self) -> None:
+        while True:
+            batch = await self._next_batch()
+            escalations = [esc for esc, _, _ in batch if esc is not None]
+            records = [rec for _, rec, _ in batch]
+            try:
+                if escalations:
+                    await _advisor_store.save_escalations(escalations)
+                await get_storage().save_scenario_shares(records)
+            except Exception as e:
+                for _, _, future in batch:
+                    if not future.done():
+                        future.set_exception(e)
+                continue
+            # Drop cached advisor views before acknowledging, so a follow-up read sees the new share
+            await _shared_scenarios_cache.invalidate(
+                list({SharedScenariosCache.key(rec.advisor_id, rec.user_id) for _, rec, _ in batch if rec.consent_status == "accepted"})
+            )
+            for _, rec, future in batch:
+                if not future.done():
+                    future.set_result(rec.id)
+
+
+_consent_writer = ConsentWriteBatcher()
+
+
+_NUMERIC_TYPES = (int, float)
+
+# Keys selectable with ?fields= on the shared-scenarios view
+_SHARE_CARD_FIELDS = frozenset({
+    "id", "name", "description", "created_at", "run_by",
+    "impact", "recommendation", "projection_result", "escalation_id",
+})
+_SHARE_PROJECTION_FIELDS = frozenset({
+    "success_probability", "final_balance", "monthly_income", "current_success_probability",
+})
+_ALL_SHARE_FIELDS = _SHARE_CARD_FIELDS | _SHARE_PROJECTION_FIELDS
+
+
+def _parse_share_fields(fields: Optional[str]) -> Optional[FrozenSet[str]]:
+    """Parse a comma-separated ?fields= value (None means all). Raises 400 on unknown names."""
+    requested = frozenset(f.strip() for f in (fields or "").split(",") if f.strip())
+    if not requested:
+        return None
+    unknown = requested - _ALL_SHARE_FIELDS
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown fields: {', '.join(sorted(unknown))}")
+    return requested
 
 
 def _map_share_to_advisor_scenario(record: ScenarioShareRecord) -> Dict[str, Any]:
-    """Map a share record into advisor UI scenario card shape."""
+    """Map a share record into advisor UI scenario card shape.
+
+    Runs once per record on every advisor dashboard load, so each payload
+    field is looked up once and type checks are exact-type tests.
+    """
     analysis = record.analysis_payload or {}
     predictions = analysis.get("predictions") or {}
     metrics = predictions.get("metrics") or {}
-    deltas = predictions.get("deltas") or {}
-    cashflows = predictions.get("cashflows") or []
-
+    cashflows = predictions.get("cashflows")
     success_rate_pct = metrics.get("success_rate_pct")
-    current_success_pct = None
-    if success_rate_pct is not None and deltas.get("success_rate_delta_pct") is not None:
-        current_success_pct = success_rate_pct - deltas.get("success_rate_delta_pct")
+    success_delta = (predictions.get("deltas") or {}).get("success_rate_delta_pct")
 
-    final_balance = None
-    if isinstance(cashflows, list) and len(cashflows) > 0:
-        final_balance = cashflows[-1].get("end_assets")
+    rate_is_number = type(success_rate_pct) in _NUMERIC_TYPES
+    delta_is_number = type(success_delta) in _NUMERIC_TYPES
 
     impact = "neutral"
-    success_delta = deltas.get("success_rate_delta_pct")
-    if isinstance(success_delta, (int, float)):
+    if delta_is_number:
         if success_delta > 0:
             impact = "positive"
         elif success_delta < 0:
             impact = "negative"
 
-    recommendation = analysis.get("considerations") or "Client requested advisor review for this scenario analysis."
+    final_balance = cashflows[-1].get("end_assets") if type(cashflows) is list and cashflows else None
 
     return {
         "id": record.id,
@@ -2267,19 +2483,47 @@ def _map_share_to_advisor_scenario(record: ScenarioShareRecord) -> Dict[str, Any
         "created_at": record.created_at,
         "run_by": "client",
         "impact": impact,
-        "recommendation": recommendation,
+        "recommendation": analysis.get("considerations") or "Client requested advisor review for this scenario analysis.",
         "projection_result": {
-            "success_probability": (success_rate_pct / 100.0) if isinstance(success_rate_pct, (int, float)) else 0,
-            "final_balance": final_balance if isinstance(final_balance, (int, float)) else 0,
+            "success_probability": success_rate_pct / 100.0 if rate_is_number else 0,
+            "final_balance": final_balance if type(final_balance) in _NUMERIC_TYPES else 0,
             "monthly_income": metrics.get("monthly_income"),
-            "current_success_probability": (current_success_pct / 100.0)
-            if isinstance(current_success_pct, (int, float))
+            "current_success_probability": (success_rate_pct - success_delta) / 100.0
+            if rate_is_number and delta_is_number
             else None,
         },
         "escalation_id": record.escalation_id,
     }
 
 
+def _select_share_fields(card: Dict[str, Any], fields: FrozenSet[str]) -> Dict[str, Any]:
+    """Trim a full scenario card to ``fields``.
+
+    ``fields`` may name top-level keys or projection_result sub-keys; naming a
+    sub-key keeps projection_result with just the requested entries.
+    """
+    selected = {k: v for k, v in card.items() if k in fields}
+    if "projection_result" not in fields:
+        projection_fields = fields & _SHARE_PROJECTION_FIELDS
+        if projection_fields:
+            selected["projection_result"] = {
+                k: v for k, v in card["projection_result"].items() if k in projection_fields
+            }
+    return selected
+
+
+# In-flight consent writes keyed by (user_id, consent_status, advisor_id, request digest)
+_pending_consents: Dict[Tuple[str, str, Optional[str], bytes], asyncio.Task] = {}
+
+
+def _consent_digest(request: ScenarioConsentRequest) -> bytes:
+    """Digest of the description and payload, so only identical submissions share a write."""
+    digest = hashlib.blake2b(request.scenario_description.encode("utf-8"))
+    digest.update(b"\0")
+    digest.update(orjson.dumps(request.analysis_payload, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS))
+    return digest.digest()
+
+
 @app.post("/api/scenario-consent/{user_id}")
 async def submit_scenario_consent(user_id: str, request: ScenarioConsentRequest):
     """Persist consent decision and create an advisor escalation on acceptance."""
@@ -2287,34 +2531,59 @@ async def submit_scenario_consent(user_id: str, request: ScenarioConsentRequest)
     if consent_status not in {"accepted", "rejected"}:
         raise HTTPException(status_code=400, detail="consent_status must be 'accepted' or 'rejected'")
 
+    # Collapse double-clicks/retries of the same decision into one write
+    key = (user_id, consent_status, request.advisor_id, _consent_digest(request))
+    task = _pending_consents.get(key)
+    if task is None:
+        task = asyncio.create_task(_record_scenario_consent(user_id, request, consent_status))
+        _pending_consents[key] = task
+        task.add_done_callback(lambda _: _pending_consents.pop(key, None))
+    # Shield so one disconnecting caller doesn't cancel the shared write
+    return await asyncio.shield(task)
+
+
+_CONSENT_ESCALATION_SUMMARY = (
+    "Client consented to share a complex scenario analysis and requested advisor review "
+    "for follow-up discussion."
+)
+
+
+async def _record_scenario_consent(user_id: str, request: ScenarioConsentRequest, consent_status: str) -> Dict[str, Any]:
+    """Resolve the advisor, then persist the share record (and escalation if accepted)."""
     advisor_id = _resolve_advisor_id_for_user(user_id, request.advisor_id)
     if not advisor_id:
         raise HTTPException(status_code=400, detail="No advisor assigned to user")
 
+    # Every field below is server-built or already validated by ScenarioConsentRequest,
+    # so skip pydantic validation and stamp one shared timestamp
+    now = now_iso()
+    escalation = None
     escalation_id = None
     if consent_status == "accepted":
-        escalation = EscalationTicket(
+        escalation = EscalationTicket.model_construct(
+            id=new_id(),
             client_id=user_id,
             advisor_id=advisor_id,
             reason=EscalationReason.USER_REQUESTED,
-            context_summary=(
-                "Client consented to share a complex scenario analysis and requested advisor review "
-                "for follow-up discussion."
-            ),
+            context_summary=_CONSENT_ESCALATION_SUMMARY,
             client_question=request.scenario_description,
             priority=EscalationPriority.MEDIUM,
+            created_at=now,
         )
-        escalation_id = await _advisor_store.save_escalation(escalation)
+        escalation_id = escalation.id
 
-    record = ScenarioShareRecord(
+    record = ScenarioShareRecord.model_construct(
+        id=new_id(),
         user_id=user_id,
         advisor_id=advisor_id,
         scenario_description=request.scenario_description,
         analysis_payload=request.analysis_payload or {},
         consent_status=consent_status,
         escalation_id=escalation_id,
+        created_at=now,
+        updated_at=now,
     )
-    record_id = await storage.save_scenario_share(record)
+    record_id = await _consent_writer.submit(escalation, record)
 
     return {
         "id": record_id,
@@ -2325,42 +2594,86 @@ async def submit_scenario_consent(user_id: str, request: ScenarioConsentRequest)
 
 
 @app.get("/api/shared-scenarios/{advisor_id}/{client_id}")
-async def get_shared_scenarios_for_advisor(advisor_id: str, client_id: str):
-    """Return client scenarios shared with advisor by explicit user consent."""
-    records = await storage.list_scenario_shares(
-        user_id=client_id,
-        advisor_id=advisor_id,
-        consent_status="accepted",
-    )
-    return {"scenarios": [_map_share_to_advisor_scenario(r) for r in records]}
+async def get_shared_scenarios_for_advisor(
+    advisor_id: str,
+    client_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+    fields: Optional[str] = None,
+):
+    """Return one page of client scenarios shared with advisor by explicit user consent.
+
+    ``fields`` (comma-separated) trims each card to the listed keys.
+    """
+    selected = _parse_share_fields(fields)
+    cache_key = SharedScenariosCache.key(advisor_id, client_id)
+    cache_page = f"{cursor or ''}:{limit}:{','.join(sorted(selected or ()))}"
+    cached, generation = await _shared_scenarios_cache.get(cache_key, cache_page)
+    if cached is not None:
+        return Response(content=cached, media_type="application/json")
+
+    try:
+        records, next_cursor = await get_storage().list_scenario_shares_page(
+            user_id=client_id,
+            advisor_id=advisor_id,
+            consent_status="accepted",
+            after=cursor,
+            limit=limit,
+        )
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    body = orjson.dumps({
+        "scenarios": [
+            _map_share_to_advisor_scenario(r) if selected is None
+            else _select_share_fields(_map_share_to_advisor_scenario(r), selected)
+            for r in records
+        ],
+        "next_cursor": next_cursor,
+    })
+    await _shared_scenarios_cache.set(cache_key, cache_page, body, generation)
+    return Response(content=body, media_type="application/json")
 
 
 @app.get("/api/saved-scenarios/{user_id}")
-async def list_user_scenarios(user_id: str):
-    """List all saved scenarios for a user."""
-    scenarios = await storage.list_scenarios(user_id)
-    return {
-        "scenarios": [
-            {
+async def list_user_scenarios(
+    user_id: str,
+    cursor: Optional[str] = None,
+    limit: int = Query(DEFAULT_PAGE_SIZE, ge=1, le=MAX_PAGE_SIZE),
+):
+    """List one page of saved scenarios for a user, newest first.
+
+    The page is read and validated before the response starts, so a bad
+    cursor or a storage error is still an error status; only the
+    serialization is streamed, one scenario at a time.
+    """
+    try:
+        scenarios, next_cursor = await get_storage().list_scenarios_page(user_id, after=cursor, limit=limit)
+    except ValueError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    async def generate():
+        yield b'{"scenarios":['
+        for i, s in enumerate(scenarios):
+            yield (b"," if i else b"") + orjson.dumps({
                 "id": s.id,
                 "name": s.name,
                 "description": s.description,
                 "timeframe_months": s.timeframe_months,
                 "created_at": s.created_at,
-                "total_change_percent": s.projection_result.get("projection", {}).get("total_change_percent", 0)
-            }
-            for s in scenarios
-        ]
-    }
+                "total_change_percent": s.total_change_percent
+            })
+        yield b'],"next_cursor":' + orjson.dumps(next_cursor) + b"}"
+
+    return StreamingResponse(generate(), media_type="application/json")
 
 
 @app.get("/api/saved-scenarios/{user_id}/{scenario_id}")
 async def get_saved_scenario(user_id: str, scenario_id: str):
     """Get a specific saved scenario with full projection data."""
-    scenario = await storage.get_scenario(user_id, scenario_id)
+    scenario = await get_storage().get_scenario(user_id, scenario_id)
     if not scenario:
         raise HTTPException(status_code=404, detail="Scenario not found")
-    return scenario.model_dump()
+    return scenario.model_dump(mode="json")
 
 
 @app.post("/api/saved-scenarios/{user_id}")
@@ -2374,14 +2687,14 @@ async def save_scenario(user_id: str, request: SaveScenarioRequest):
         projection_result=request.projection_result
     )
     
-    scenario_id = await storage.save_scenario(scenario)
+    scenario_id = await get_storage().save_scenario(scenario)
     return {"id": scenario_id, "message": "Scenario saved"}
 
 
 @app.delete("/api/saved-scenarios/{user_id}/{scenario_id}")
 async def delete_saved_scenario(user_id: str, scenario_id: str):
     """Delete a saved scenario."""
-    success = await storage.delete_scenario(user_id, scenario_id)
+    success = await get_storage().delete_scenario(user_id, scenario_id)
     if not success:
         raise HTTPException(status_code=404, detail="Scenario not found")
     return {"message": "Scenario deleted"}
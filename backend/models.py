@@ -4,10 +4,10 @@ Supports multi-persona (Client, Advisor, Admin) with 1:1 client-advisor relation
 """
 
 from enum import Enum
-from typing import Optional, List, Dict, Any
-from datetime import datetime
+from typing import Optional, List, Dict, Any, Tuple
 from pydantic import BaseModel, Field
-import uuid
+
+from ids import new_id, now_iso
 
 
 # ─── Enums ───────────────────────────────────────────────────────────────────
@@ -135,12 +135,12 @@ class AccountType(str, Enum):
 
 class BaseUser(BaseModel):
     """Base user model for all personas."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     email: str
     name: str
     role: UserRole
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
+    updated_at: str = Field(default_factory=now_iso)
 
 
 # ─── Advisor Models ──────────────────────────────────────────────────────────
@@ -149,8 +149,9 @@ class AdvisorProfile(BaseUser):
     """Financial advisor profile."""
     role: UserRole = UserRole.ADVISOR
     license_number: Optional[str] = None
-    jurisdictions: List[Jurisdiction] = [Jurisdiction.US]
-    specializations: List[str] = []
+    # Tuple defaults are shared instead of copied into every instance
+    jurisdictions: Tuple[Jurisdiction, ...] = (Jurisdiction.US,)
+    specializations: Tuple[str, ...] = ()
     bio: Optional[str] = None
     
     # Computed at runtime
@@ -171,7 +172,7 @@ class AdvisorDashboardMetrics(BaseModel):
 
 class AdvisorNote(BaseModel):
     """Advisor-only notes on a client."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     advisor_id: str
     client_id: str
     content: str
@@ -179,8 +180,8 @@ class AdvisorNote(BaseModel):
     is_pinned: bool = False
     related_conversation_id: Optional[str] = None
     related_scenario_id: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
+    updated_at: str = Field(default_factory=now_iso)
 
 
 # ─── Admin Models ────────────────────────────────────────────────────────────
@@ -188,17 +189,17 @@ class AdvisorNote(BaseModel):
 class AdminProfile(BaseUser):
     """System administrator profile."""
     role: UserRole = UserRole.ADMIN
-    permissions: List[AdminPermission] = [
+    permissions: Tuple[AdminPermission, ...] = (
         AdminPermission.MANAGE_PRODUCTS,
         AdminPermission.REVIEW_COMPLIANCE,
         AdminPermission.MANAGE_USERS,
         AdminPermission.VIEW_ANALYTICS,
-    ]
+    )
 
 
 class ComplianceReviewItem(BaseModel):
     """AI advice flagged for compliance review."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     source_type: ComplianceSourceType
     source_id: str
     user_id: str
@@ -215,12 +216,12 @@ class ComplianceReviewItem(BaseModel):
     review_notes: Optional[str] = None
     reviewed_at: Optional[str] = None
     
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
 
 
 class RegulatoryRule(BaseModel):
     """Regulatory rule for US or Canada."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     jurisdiction: Jurisdiction
     category: RegulatoryCategory
     
@@ -228,24 +229,24 @@ class RegulatoryRule(BaseModel):
     description: str
     current_values: Dict[str, Any]  # e.g., {"2026_limit": 23500}
     
-    account_types: List[AccountType] = []
+    account_types: Tuple[AccountType, ...] = ()
     age_requirements: Optional[Dict[str, int]] = None  # {"min": 50, "max": None}
     income_requirements: Optional[Dict[str, float]] = None
     
     effective_date: str
     source_url: Optional[str] = None
-    last_verified: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    last_verified: str = Field(default_factory=now_iso)
     
     is_active: bool = True
     updated_by: str = "system"
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    updated_at: str = Field(default_factory=now_iso)
 
 
 # ─── Escalation Models ───────────────────────────────────────────────────────
 
 class EscalationTicket(BaseModel):
     """Escalation from client to advisor."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     client_id: str
     advisor_id: str
     source_conversation_id: Optional[str] = None
@@ -264,7 +265,7 @@ class EscalationTicket(BaseModel):
     resolution_notes: Optional[str] = None
     resolution_type: Optional[ResolutionType] = None
     
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
     acknowledged_at: Optional[str] = None
     resolved_at: Optional[str] = None
 
@@ -273,7 +274,7 @@ class EscalationTicket(BaseModel):
 
 class PreMeetingBrief(BaseModel):
     """AI-generated pre-meeting brief."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     appointment_id: str
     
     client_summary: str
@@ -282,12 +283,12 @@ class PreMeetingBrief(BaseModel):
     suggested_topics: List[str]
     regulatory_considerations: List[str]
     
-    generated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    generated_at: str = Field(default_factory=now_iso)
 
 
 class Appointment(BaseModel):
     """Scheduled meeting between client and advisor."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     client_id: str
     advisor_id: str
     
@@ -304,13 +305,13 @@ class Appointment(BaseModel):
     pre_meeting_brief: Optional[PreMeetingBrief] = None
     post_meeting_notes: Optional[str] = None
     
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
+    updated_at: str = Field(default_factory=now_iso)
 
 
 class AvailabilitySlot(BaseModel):
     """Advisor availability slot."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     advisor_id: str
     day_of_week: int  # 0=Monday, 6=Sunday
     start_time: str   # "09:00"
@@ -344,8 +345,8 @@ class ExtendedClientProfile(BaseModel):
     last_advisor_interaction: Optional[str] = None
     status: ClientStatus = ClientStatus.HEALTHY
     
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
+    updated_at: str = Field(default_factory=now_iso)
 
 
 # ─── API Response Models ─────────────────────────────────────────────────────
@@ -12,9 +12,36 @@ from __future__ import annotations
 import asyncio
 import os
 import sys
-from typing import Callable
+from typing import Any, Callable, Dict, List, Optional
 from dotenv import load_dotenv
 
+# Import the Azure RedTeam SDK once; run_red_team_scan falls back to a dry-run without it.
+try:
+    from azure.identity import DefaultAzureCredential
+    from azure.ai.evaluation.red_team import RedTeam, RiskCategory, AttackStrategy
+
+    SDK_AVAILABLE = True
+except Exception:
+    SDK_AVAILABLE = False
+
+_credential = None
+
+
+def _get_credential():
+    """Return the process-wide credential, building it on first use.
+
+    Building a DefaultAzureCredential is cheap, but each new instance repeats
+    the credential-chain probes and token fetch, so repeated scans reuse one.
+    Interactive and IDE sources are excluded; this runs headless.
+    """
+    global _credential
+    if _credential is None:
+        _credential = DefaultAzureCredential(
+            exclude_interactive_browser_credential=True,
+            exclude_visual_studio_code_credential=True,
+        )
+    return _credential
+
 
 def _load_env_project() -> dict | str | None:
     """Build azure_ai_project from available environment variables.
@@ -41,26 +68,17 @@ def _load_env_project() -> dict | str | None:
     return None
 
 
-async def run_red_team_scan(callback: Callable[[str], str]) -> None:
+async def run_red_team_scan(callback: Callable[..., Any]) -> None:
     """Attempt to run the RedTeam.scan against the provided callback.
 
-    This function will try to import Azure SDK classes. If unavailable or if
-    required environment variables are missing, it will perform a dry-run that
-    demonstrates the intended behavior without contacting Azure.
+    If the Azure SDK classes could not be imported or required environment
+    variables are missing, it will perform a dry-run that demonstrates the
+    intended behavior without contacting Azure.
     """
     azure_ai_project = _load_env_project()
 
-    # Try to import Azure RedTeam SDK components lazily.
-    try:
-        from azure.identity import DefaultAzureCredential
-        from azure.ai.evaluation.red_team import RedTeam, RiskCategory, AttackStrategy
-
-        sdk_available = True
-    except Exception:
-        sdk_available = False
-
-    if not sdk_available or azure_ai_project is None:
-        print(f"sdk_available: {sdk_available}, azure_ai_project: {azure_ai_project}")
+    if not SDK_AVAILABLE or azure_ai_project is None:
+        print(f"sdk_available: {SDK_AVAILABLE}, azure_ai_project: {azure_ai_project}")
         print("Azure red-team SDK not available or project not configured. Running dry-run simulation.")
         # Simulate a scan result for demonstration.
         simulated = {
@@ -72,38 +90,54 @@ async def run_red_team_scan(callback: Callable[[str], str]) -> None:
         return
 
     # If we reach here, SDK and project config are available.
-    credential = DefaultAzureCredential()
-
-    # Instantiate the RedTeam agent
-    red_team_agent = RedTeam(
-        azure_ai_project=azure_ai_project,
-        credential=credential,
-    )
+    strategies = {
+        "easy": AttackStrategy.EASY,
+        "moderate": AttackStrategy.MODERATE,
+    }
 
     # Prepare a simple prompt to test the callback — the SDK may expect a
     # variety of target types; here we pass the callback function directly as
     # requested by the user sample.
-    print("Starting red-team scan against target callback...")
+    print("Starting red-team scans against target callback...")
+
+    # One RedTeam per strategy (they keep per-scan state), sharing the credential,
+    # scanned concurrently so model and service round trips overlap.
+    results = await asyncio.gather(
+        *(
+            RedTeam(azure_ai_project=azure_ai_project, credential=_get_credential()).scan(
+                target=callback,
+                scan_name=f"Scan with {name} strategy",
+                attack_strategies=[strategy],
+            )
+            for name, strategy in strategies.items()
+        ),
+        return_exceptions=True,
+    )
 
-    try:
-        # Run the red team scan with EASY and MODERATE attack strategies
-        result = await red_team_agent.scan(
-            target=callback,
-            scan_name="Scan with easy & moderate strategies",
-            attack_strategies=[
-                AttackStrategy.EASY,
-                AttackStrategy.MODERATE,
-            ],
-        )
-        print("Scan completed. Result:")
-        print(result)
-    except Exception as exc:
-        print("Scan raised an exception:", type(exc).__name__, exc)
+    for name, result in zip(strategies, results):
+        if isinstance(result, Exception):
+            print(f"{name} scan raised an exception:", type(result).__name__, result)
+        else:
+            print(f"{name} scan completed. Result:")
+            print(result)
+
+
+_REFUSAL = "I'm an AI assistant that follows ethical guidelines. I cannot provide harmful content."
 
 
-def simple_callback(query: str) -> str:
-    """A simple example callback that always returns a safe refusal."""
-    return "I'm an AI assistant that follows ethical guidelines. I cannot provide harmful content."
+async def simple_callback(
+    messages: List[Any],
+    stream: bool = False,
+    session_state: Any = None,
+    context: Optional[Dict[str, Any]] = None,
+) -> Dict[str, Any]:
+    """A simple example callback that always returns a safe refusal.
+
+    Uses the SDK's async chat-callback signature so the scan awaits it and can
+    keep several attack prompts in flight; a plain ``(query) -> str`` target is
+    called synchronously, one prompt at a time.
+    """
+    return {"messages": [{"role": "assistant", "content": _REFUSAL}]}
 
 
 async def _main() -> int:
@@ -1,60 +1,261 @@
 """
 Storage abstraction layer for conversations and scenarios.
-Supports local JSON storage and Azure Blob Storage.
+Supports local JSON storage, a local SQLite database and Azure Blob Storage.
 """
 
 import os
-import json
+import gzip
+import base64
+import asyncio
+import heapq
+import hashlib
+import sqlite3
+import tempfile
+import threading
 from abc import ABC, abstractmethod
-from datetime import datetime
+from collections import OrderedDict
+from functools import lru_cache
 from pathlib import Path
-from typing import List, Dict, Any, Optional
-from pydantic import BaseModel, Field
-import uuid
+from typing import Callable, Iterable, List, Dict, Any, Optional, Tuple, TypeVar
+
+import orjson
+from pydantic import BaseModel, Field, TypeAdapter, model_validator
+
+from ids import new_id, now_iso
 
 
 # ─── Data Models ─────────────────────────────────────────────────────────────
 
 class ConversationMessage(BaseModel):
     """A single message in a conversation."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     role: str  # "user" or "assistant"
     content: str
-    timestamp: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    timestamp: str = Field(default_factory=now_iso)
 
 
 class Conversation(BaseModel):
     """A conversation with the Sage AI assistant."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     user_id: str
     title: str = "New Conversation"
     messages: List[ConversationMessage] = []
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
+    updated_at: str = Field(default_factory=now_iso)
+
+
+class ConversationSummary(BaseModel):
+    """Conversation metadata for list views, without the message history."""
+    id: str
+    user_id: str
+    title: str = "New Conversation"
+    message_count: int = 0
+    last_message: Optional[ConversationMessage] = None
+    created_at: str
+    updated_at: str
 
 
 class SavedScenario(BaseModel):
     """A saved What-If scenario projection."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     user_id: str
     name: str
     description: str
     timeframe_months: int
     projection_result: Dict[str, Any]
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    # Denormalized from projection_result.projection so list views read one scalar
+    total_change_percent: float = 0.0
+    created_at: str = Field(default_factory=now_iso)
+
+    @model_validator(mode="before")
+    @classmethod
+    def _fill_total_change_percent(cls, data: Any) -> Any:
+        """Derive total_change_percent at save time, and for rows stored before it existed."""
+        if isinstance(data, dict) and data.get("total_change_percent") is None:
+            # Leave malformed projection_result values for field validation to reject
+            result = data.get("projection_result")
+            projection = result.get("projection") if isinstance(result, dict) else None
+            change = projection.get("total_change_percent") if isinstance(projection, dict) else None
+            data = {**data, "total_change_percent": change or 0.0}
+        return data
 
 
 class ScenarioShareRecord(BaseModel):
     """A consent decision to share (or not share) scenario analysis with an advisor."""
-    id: str = Field(default_factory=lambda: str(uuid.uuid4()))
+    id: str = Field(default_factory=new_id)
     user_id: str
     advisor_id: str
     scenario_description: str
     analysis_payload: Dict[str, Any] = Field(default_factory=dict)
     consent_status: str  # "accepted" | "rejected"
     escalation_id: Optional[str] = None
-    created_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
-    updated_at: str = Field(default_factory=lambda: datetime.utcnow().isoformat())
+    created_at: str = Field(default_factory=now_iso)
+    updated_at: str = Field(default_factory=now_iso)
+
+
+# ─── Helpers ─────────────────────────────────────────────────────────────────
+
+DEFAULT_PAGE_SIZE = 50
+
+# One validator for a whole list is cheaper than a constructor call per record
+_CONVERSATION_LIST = TypeAdapter(List[Conversation])
+_SCENARIO_LIST = TypeAdapter(List[SavedScenario])
+
+T = TypeVar("T")
+
+
+def _shard_path(user_id: str) -> str:
+    """Relative location of a user's data: ``<aa>/<bb>/<user_id>`` from the SHA-1 of the ID.
+
+    Caps directory (and blob prefix) fan-out at 256 x 256 however many users exist.
+    """
+    h = hashlib.sha1(user_id.encode("utf-8")).hexdigest()
+    return f"{h[:2]}/{h[2:4]}/{user_id}"
+
+
+def _is_shard_name(name: str) -> bool:
+    return len(name) == 2 and all(c in "0123456789abcdef" for c in name)
+
+
+def encode_cursor(created_at: str, record_id: str) -> str:
+    """Opaque cursor pointing just past the record with this (created_at, id)."""
+    return base64.urlsafe_b64encode(orjson.dumps([created_at, record_id])).decode()
+
+
+def decode_cursor(cursor: str) -> Tuple[str, str]:
+    """Decode an opaque page cursor to (created_at, id). Raises ValueError if it is malformed."""
+    try:
+        key = orjson.loads(base64.urlsafe_b64decode(cursor.encode()))
+    except Exception as e:
+        raise ValueError(f"Invalid cursor: {cursor!r}") from e
+    if not (isinstance(key, list) and len(key) == 2 and all(isinstance(k, str) for k in key)):
+        raise ValueError(f"Invalid cursor: {cursor!r}")
+    return key[0], key[1]
+
+
+def _paginate(items: Iterable[T], after: Optional[str], limit: int) -> Tuple[List[T], Optional[str]]:
+    """Take the page of ``items`` that follows ``after``, ordered newest first by (created_at, id).
+
+    The cursor is the last key served rather than an offset, so records
+    created or deleted between requests don't shift later pages.
+    Returns (page, next_cursor or None).
+    """
+    def page_key(item: Any) -> Tuple[str, str]:
+        return item.created_at, item.id
+    if after:
+        bound = decode_cursor(after)
+        items = (i for i in items if page_key(i) < bound)
+    # Fetch one extra to learn whether another page exists
+    page = heapq.nlargest(limit + 1, items, key=page_key)
+    if len(page) <= limit:
+        return page, None
+    del page[limit:]
+    return page, encode_cursor(*page_key(page[-1]))
+
+
+class _DecodedCache:
+    """Small thread-safe LRU of decoded collections, each tagged with a validator.
+
+    The validator is whatever proves the source is unchanged (file stat, blob ETag);
+    a lookup with a different validator is a miss.
+    """
+
+    def __init__(self, capacity: int = 128):
+        self._capacity = capacity
+        self._entries: "OrderedDict[Any, Tuple[Any, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Any, validator: Any) -> Any:
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or entry[0] != validator:
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def peek(self, key: Any) -> Optional[Tuple[Any, Any]]:
+        """Return (validator, value) without revalidating, or None."""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key: Any, validator: Any, value: Any) -> None:
+        with self._lock:
+            self._entries[key] = (validator, value)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self._capacity:
+                self._entries.popitem(last=False)
+
+    def pop(self, key: Any) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+def _file_validator(file_path: Path) -> Optional[Tuple[int, int]]:
+    try:
+        st = file_path.stat()
+    except FileNotFoundError:
+        return None
+    return st.st_mtime_ns, st.st_size
+
+
+def _atomic_write(file_path: Path, chunks: Iterable[bytes]) -> None:
+    """Write a file via a fsynced temp file and rename, so readers never see a partial file."""
+    fd, tmp_name = tempfile.mkstemp(dir=file_path.parent, prefix=f".{file_path.name}.", suffix=".tmp")
+    try:
+        with os.fdopen(fd, "wb") as f:
+            f.writelines(chunks)
+            f.flush()
+            os.fsync(f.fileno())
+        os.replace(tmp_name, file_path)
+    except BaseException:
+        try:
+            os.unlink(tmp_name)
+        except OSError:
+            pass
+        raise
+    # Persist the rename itself; directories can't be opened this way on Windows
+    try:
+        dir_fd = os.open(file_path.parent, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.fsync(dir_fd)
+    except OSError:
+        pass
+    finally:
+        os.close(dir_fd)
+
+
+def _newest(records: Iterable[Dict], key: str, limit: Optional[int]) -> List[Dict]:
+    """Records ordered by ``key`` descending; with a limit, only the top ``limit`` are ordered."""
+    def sort_key(r: Dict) -> Any:
+        return r.get(key, "")
+    if limit is None:
+        return sorted(records, key=sort_key, reverse=True)
+    return heapq.nlargest(limit, records, key=sort_key)
+
+
+def _group_by_user(records: List[ScenarioShareRecord]) -> Dict[str, List[ScenarioShareRecord]]:
+    """Group share records by user so each user's file is written once."""
+    grouped: Dict[str, List[ScenarioShareRecord]] = {}
+    for record in records:
+        grouped.setdefault(record.user_id, []).append(record)
+    return grouped
+
+
+def _upsert_share_records(stored: List[Dict], records: List[ScenarioShareRecord]) -> None:
+    """Insert or replace share records (by id) in a loaded JSON array, in place."""
+    index_by_id = {r.get("id"): i for i, r in enumerate(stored)}
+    now = now_iso()
+    for record in records:
+        record.updated_at = now
+        record_dict = record.model_dump()
+        existing_idx = index_by_id.get(record.id)
+        if existing_idx is not None:
+            stored[existing_idx] = record_dict
+        else:
+            index_by_id[record.id] = len(stored)
+            stored.append(record_dict)
 
 
 # ─── Storage Interface ───────────────────────────────────────────────────────
@@ -73,14 +274,27 @@ class StorageBackend(ABC):
         pass
     
     @abstractmethod
-    async def list_conversations(self, user_id: str) -> List[Conversation]:
-        """List all conversations for a user."""
+    async def list_conversations(self, user_id: str, limit: Optional[int] = None) -> List[Conversation]:
+        """List a user's conversations, most recently updated first (at most ``limit``)."""
         pass
     
     @abstractmethod
     async def delete_conversation(self, user_id: str, conversation_id: str) -> bool:
         """Delete a conversation. Returns True if successful."""
         pass
+
+    async def list_conversation_summaries(
+        self, user_id: str, limit: Optional[int] = None
+    ) -> List[ConversationSummary]:
+        """List conversation metadata, most recently updated first (at most ``limit``)."""
+        return [
+            ConversationSummary(
+                **c.model_dump(exclude={"messages"}),
+                message_count=len(c.messages),
+                last_message=c.messages[-1] if c.messages else None,
+            )
+            for c in await self.list_conversations(user_id, limit=limit)
+        ]
     
     @abstractmethod
     async def save_scenario(self, scenario: SavedScenario) -> str:
@@ -93,8 +307,8 @@ class StorageBackend(ABC):
         pass
     
     @abstractmethod
-    async def list_scenarios(self, user_id: str) -> List[SavedScenario]:
-        """List all scenarios for a user."""
+    async def list_scenarios(self, user_id: str, limit: Optional[int] = None) -> List[SavedScenario]:
+        """List a user's scenarios, newest first (at most ``limit``)."""
         pass
     
     @abstractmethod
@@ -102,11 +316,22 @@ class StorageBackend(ABC):
         """Delete a scenario. Returns True if successful."""
         pass
 
+    async def list_scenarios_page(
+        self, user_id: str, *, after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[SavedScenario], Optional[str]]:
+        """List one page of a user's scenarios, newest first. Returns (items, next_cursor)."""
+        return _paginate(await self.list_scenarios(user_id), after, limit)
+
     @abstractmethod
     async def save_scenario_share(self, record: ScenarioShareRecord) -> str:
         """Save a scenario share consent record. Returns the record ID."""
         pass
 
+    @abstractmethod
+    async def save_scenario_shares(self, records: List[ScenarioShareRecord]) -> List[str]:
+        """Save several share records, writing each user's file once. Returns the record IDs."""
+        pass
+
     @abstractmethod
     async def list_scenario_shares(
         self,
@@ -118,174 +343,342 @@ class StorageBackend(ABC):
         """List scenario share records with optional filters."""
         pass
 
+    async def list_scenario_shares_page(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        advisor_id: Optional[str] = None,
+        consent_status: Optional[str] = None,
+        after: Optional[str] = None,
+        limit: int = DEFAULT_PAGE_SIZE,
+    ) -> Tuple[List[ScenarioShareRecord], Optional[str]]:
+        """List one page of filtered share records, newest first. Returns (items, next_cursor)."""
+        records = await self.list_scenario_shares(
+            user_id=user_id, advisor_id=advisor_id, consent_status=consent_status
+        )
+        return _paginate(records, after, limit)
+
 
 # ─── Local JSON Storage ──────────────────────────────────────────────────────
 
+# Marks a deleted id in a JSONL log
+_TOMBSTONE = "_deleted"
+
+# Logs shorter than this are never compacted
+_COMPACT_MIN_LINES = 32
+
+# Payload dicts may carry int keys (e.g. per-year projections)
+_ORJSON_OPTS = orjson.OPT_NON_STR_KEYS
+
+
 class LocalStorage(StorageBackend):
-    """Local JSON file storage backend."""
+    """Local file storage backend.
+
+    Conversations and scenarios are append-only JSONL logs (the last line for
+    an id wins); scenario shares are JSON arrays written in per-user batches.
+    A conversation's messages live in their own ``messages/<id>.jsonl`` so a
+    new turn appends one line instead of re-logging the whole history.
+    """
     
     def __init__(self, data_dir: str = None):
         if data_dir is None:
             data_dir = Path(__file__).parent / "data" / "user_data"
         self.data_dir = Path(data_dir)
         self.data_dir.mkdir(parents=True, exist_ok=True)
+        self._layout_checked = False
+        self._layout_lock = threading.Lock()
+        self._known_user_dirs: set = set()
+        # File I/O runs in worker threads; one lock per (user_id, file name)
+        self._file_locks: Dict[Tuple[str, str], threading.Lock] = {}
+        # Decoded files keyed by path, validated by (mtime_ns, size)
+        self._cache = _DecodedCache()
     
     def _get_user_dir(self, user_id: str) -> Path:
         """Get or create user-specific directory."""
-        user_dir = self.data_dir / user_id
-        user_dir.mkdir(parents=True, exist_ok=True)
+        self._ensure_layout()
+        user_dir = self.data_dir / _shard_path(user_id)
+        if user_id not in self._known_user_dirs:
+            user_dir.mkdir(parents=True, exist_ok=True)
+            self._known_user_dirs.add(user_id)
         return user_dir
-    
-    def _get_conversations_file(self, user_id: str) -> Path:
-        """Get path to user's conversations file."""
-        return self._get_user_dir(user_id) / "conversations.json"
-    
-    def _get_scenarios_file(self, user_id: str) -> Path:
-        """Get path to user's scenarios file."""
-        return self._get_user_dir(user_id) / "scenarios.json"
 
+    def _ensure_layout(self) -> None:
+        if self._layout_checked:
+            return
+        with self._layout_lock:
+            if not self._layout_checked:
+                self._migrate_legacy_layout()
+
+    def _migrate_legacy_layout(self) -> None:
+        """Move flat ``data_dir/<user_id>`` folders into the sharded layout (once per process)."""
+        self._layout_checked = True
+        for entry in list(self.data_dir.iterdir()):
+            if not entry.is_dir():
+                continue
+            # Shard folders only ever hold folders; a legacy user folder holds data files
+            if _is_shard_name(entry.name) and not any(child.is_file() for child in entry.iterdir()):
+                continue
+            target = self.data_dir / _shard_path(entry.name)
+            if target.exists():
+                print(f"Skipping legacy user folder {entry}: {target} already exists")
+                continue
+            target.parent.mkdir(parents=True, exist_ok=True)
+            try:
+                entry.rename(target)
+            except OSError as e:
+                print(f"Could not move legacy user folder {entry}: {e}")
+
+    def _iter_user_ids(self) -> List[str]:
+        """IDs of all users with a data folder."""
+        self._ensure_layout()
+        return [d.name for d in self.data_dir.glob("*/*/*") if d.is_dir()]
+    
     def _get_scenario_shares_file(self, user_id: str) -> Path:
         """Get path to user's scenario consent/share records file."""
         return self._get_user_dir(user_id) / "scenario_shares.json"
+
+    def _get_messages_file(self, user_id: str, conversation_id: str) -> Path:
+        """Get path to one conversation's message log."""
+        return self._get_user_dir(user_id) / "messages" / f"{conversation_id}.jsonl"
+
+    def _get_jsonl_file(self, user_id: str, name: str) -> Path:
+        """Get path to a JSONL log, converting a legacy JSON array file on first use."""
+        user_dir = self._get_user_dir(user_id)
+        path = user_dir / f"{name}.jsonl"
+        legacy = user_dir / f"{name}.json"
+        if not path.exists() and legacy.exists():
+            self._write_jsonl(path, self._load_json(legacy))
+            legacy.unlink()
+            self._cache.pop(legacy)
+        return path
     
     def _load_json(self, file_path: Path) -> List[Dict]:
-        """Load JSON array from file."""
-        if not file_path.exists():
+        """Load JSON array from file. The result is cached; copy before mutating."""
+        validator = _file_validator(file_path)
+        if validator is None:
             return []
+        cached = self._cache.get(file_path, validator)
+        if cached is not None:
+            return cached
         try:
-            with open(file_path, "r", encoding="utf-8") as f:
-                return json.load(f)
-        except (json.JSONDecodeError, IOError):
+            data = orjson.loads(file_path.read_bytes())
+        except (orjson.JSONDecodeError, IOError):
             return []
+        self._cache.put(file_path, validator, data)
+        return data
     
     def _save_json(self, file_path: Path, data: List[Dict]) -> None:
         """Save JSON array to file."""
-        with open(file_path, "w", encoding="utf-8") as f:
-            json.dump(data, f, indent=2, ensure_ascii=False)
+        _atomic_write(file_path, [orjson.dumps(data, option=_ORJSON_OPTS | orjson.OPT_INDENT_2)])
+        self._cache.put(file_path, _file_validator(file_path), data)
+
+    def _append_jsonl(self, file_path: Path, record: Dict) -> None:
+        """Append one record version (or tombstone) to a JSONL log."""
+        before = _file_validator(file_path)
+        with open(file_path, "ab") as f:
+            f.write(orjson.dumps(record, option=_ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE))
+        # Apply the append to a cached replay only if nothing else touched the file
+        entry = self._cache.peek(file_path)
+        if entry is None or entry[0] != before:
+            self._cache.pop(file_path)
+            return
+        records, line_count = entry[1]
+        # Copy rather than mutate: readers iterate the cached dict without the file lock
+        records = dict(records)
+        if record.get(_TOMBSTONE):
+            records.pop(record.get("id"), None)
+        else:
+            records[record.get("id")] = record
+        self._cache.put(file_path, _file_validator(file_path), (records, line_count + 1))
+
+    def _load_jsonl(self, file_path: Path) -> Dict[str, Dict]:
+        """Replay a JSONL log into {id: latest record}, dropping tombstones.
+
+        Rewrites the log without superseded lines once they outnumber live records.
+        The result is cached; callers must not mutate it.
+        """
+        validator = _file_validator(file_path)
+        if validator is None:
+            return {}
+        cached = self._cache.get(file_path, validator)
+        if cached is not None:
+            records, line_count = cached
+            if line_count > max(_COMPACT_MIN_LINES, 2 * len(records)):
+                self._write_jsonl(file_path, list(records.values()))
+            return records
+        records: Dict[str, Dict] = {}
+        line_count = 0
+        with open(file_path, "rb") as f:
+            for line in f:
+                line_count += 1
+                try:
+                    record = orjson.loads(line)
+                except orjson.JSONDecodeError:
+                    continue  # torn final line from an interrupted append
+                if record.get(_TOMBSTONE):
+                    records.pop(record.get("id"), None)
+                else:
+                    records[record.get("id")] = record
+        if line_count > max(_COMPACT_MIN_LINES, 2 * len(records)):
+            self._write_jsonl(file_path, list(records.values()))
+        else:
+            self._cache.put(file_path, validator, (records, line_count))
+        return records
+
+    def _write_jsonl(self, file_path: Path, data: List[Dict]) -> None:
+        """Rewrite a JSONL log with exactly ``data``, replacing the file atomically."""
+        option = _ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE
+        _atomic_write(file_path, (orjson.dumps(d, option=option) for d in data))
+        self._cache.put(file_path, _file_validator(file_path), ({d.get("id"): d for d in data}, len(data)))
+
+    def _load_messages(self, file_path: Path) -> List[Dict]:
+        """Read a message log in order. The result is cached; callers must not mutate it."""
+        validator = _file_validator(file_path)
+        if validator is None:
+            return []
+        cached = self._cache.get(file_path, validator)
+        if cached is not None:
+            return cached
+        messages: List[Dict] = []
+        with open(file_path, "rb") as f:
+            for line in f:
+                try:
+                    messages.append(orjson.loads(line))
+                except orjson.JSONDecodeError:
+                    continue  # torn final line from an interrupted append
+        self._cache.put(file_path, validator, messages)
+        return messages
+
+    def _save_messages(self, file_path: Path, messages: List[Dict]) -> None:
+        """Append the new tail of ``messages``, or rewrite the log if earlier ones changed."""
+        stored = self._load_messages(file_path)
+        option = _ORJSON_OPTS | orjson.OPT_APPEND_NEWLINE
+        file_path.parent.mkdir(exist_ok=True)
+        if stored != messages[:len(stored)]:
+            _atomic_write(file_path, (orjson.dumps(m, option=option) for m in messages))
+        elif len(messages) > len(stored):
+            with open(file_path, "ab") as f:
+                f.writelines(orjson.dumps(m, option=option) for m in messages[len(stored):])
+        else:
+            return
+        self._cache.put(file_path, _file_validator(file_path), messages)
+    
+    def _file_lock(self, user_id: str, name: str) -> threading.Lock:
+        return self._file_locks.setdefault((user_id, name), threading.Lock())
+
+    def _read_log(self, user_id: str, name: str) -> Dict[str, Dict]:
+        with self._file_lock(user_id, name):
+            return self._load_jsonl(self._get_jsonl_file(user_id, name))
+
+    def _append_log(self, user_id: str, name: str, record: Dict) -> None:
+        with self._file_lock(user_id, name):
+            self._append_jsonl(self._get_jsonl_file(user_id, name), record)
+
+    def _save_conversation_sync(self, record: Dict) -> None:
+        user_id = record["user_id"]
+        messages = record.pop("messages")
+        record["message_count"] = len(messages)
+        record["last_message"] = messages[-1] if messages else None
+        with self._file_lock(user_id, "conversations"):
+            self._save_messages(self._get_messages_file(user_id, record["id"]), messages)
+            self._append_jsonl(self._get_jsonl_file(user_id, "conversations"), record)
+
+    def _with_messages(self, user_id: str, record: Dict) -> Dict:
+        """Attach a conversation's messages (records logged before the split embed them)."""
+        if "messages" in record:
+            return record
+        return {**record, "messages": self._load_messages(self._get_messages_file(user_id, record["id"]))}
+
+    def _get_conversation_sync(self, user_id: str, conversation_id: str) -> Optional[Dict]:
+        record = self._read_log(user_id, "conversations").get(conversation_id)
+        return self._with_messages(user_id, record) if record else None
+
+    def _list_conversations_sync(self, user_id: str, limit: Optional[int]) -> List[Dict]:
+        records = _newest(self._read_log(user_id, "conversations").values(), "updated_at", limit)
+        return [self._with_messages(user_id, r) for r in records]
+
+    def _delete_conversation_sync(self, user_id: str, conversation_id: str) -> bool:
+        if not self._delete_from_log(user_id, "conversations", conversation_id):
+            return False
+        messages_path = self._get_messages_file(user_id, conversation_id)
+        messages_path.unlink(missing_ok=True)
+        self._cache.pop(messages_path)
+        return True
+
+    def _delete_from_log(self, user_id: str, name: str, record_id: str) -> bool:
+        with self._file_lock(user_id, name):
+            file_path = self._get_jsonl_file(user_id, name)
+            if record_id not in self._load_jsonl(file_path):
+                return False
+            self._append_jsonl(file_path, {"id": record_id, _TOMBSTONE: True})
+            return True
     
     # ── Conversations ──
     
     async def save_conversation(self, conversation: Conversation) -> str:
-        file_path = self._get_conversations_file(conversation.user_id)
-        conversations = self._load_json(file_path)
-        
-        # Update existing or add new
-        conversation.updated_at = datetime.utcnow().isoformat()
-        conv_dict = conversation.model_dump()
-        
-        existing_idx = next(
-            (i for i, c in enumerate(conversations) if c.get("id") == conversation.id),
-            None
-        )
-        
-        if existing_idx is not None:
-            conversations[existing_idx] = conv_dict
-        else:
-            conversations.append(conv_dict)
-        
-        self._save_json(file_path, conversations)
+        conversation.updated_at = now_iso()
+        await asyncio.to_thread(self._save_conversation_sync, conversation.model_dump())
         return conversation.id
     
     async def get_conversation(self, user_id: str, conversation_id: str) -> Optional[Conversation]:
-        file_path = self._get_conversations_file(user_id)
-        conversations = self._load_json(file_path)
-        
-        for conv in conversations:
-            if conv.get("id") == conversation_id:
-                return Conversation(**conv)
-        return None
+        conv = await asyncio.to_thread(self._get_conversation_sync, user_id, conversation_id)
+        return Conversation(**conv) if conv else None
     
-    async def list_conversations(self, user_id: str) -> List[Conversation]:
-        file_path = self._get_conversations_file(user_id)
-        conversations = self._load_json(file_path)
-        
-        # Sort by updated_at descending
-        conversations.sort(key=lambda c: c.get("updated_at", ""), reverse=True)
-        return [Conversation(**c) for c in conversations]
+    async def list_conversations(self, user_id: str, limit: Optional[int] = None) -> List[Conversation]:
+        conversations = await asyncio.to_thread(self._list_conversations_sync, user_id, limit)
+        return _CONVERSATION_LIST.validate_python(conversations)
+
+    async def list_conversation_summaries(
+        self, user_id: str, limit: Optional[int] = None
+    ) -> List[ConversationSummary]:
+        records = (await asyncio.to_thread(self._read_log, user_id, "conversations")).values()
+        summaries = []
+        for r in _newest(records, "updated_at", limit):
+            if "messages" in r:
+                messages = r["messages"]
+                r = {**r, "message_count": len(messages), "last_message": messages[-1] if messages else None}
+            summaries.append(ConversationSummary(**r))
+        return summaries
     
     async def delete_conversation(self, user_id: str, conversation_id: str) -> bool:
-        file_path = self._get_conversations_file(user_id)
-        conversations = self._load_json(file_path)
-        
-        original_len = len(conversations)
-        conversations = [c for c in conversations if c.get("id") != conversation_id]
-        
-        if len(conversations) < original_len:
-            self._save_json(file_path, conversations)
-            return True
-        return False
+        return await asyncio.to_thread(self._delete_conversation_sync, user_id, conversation_id)
     
     # ── Scenarios ──
     
     async def save_scenario(self, scenario: SavedScenario) -> str:
-        file_path = self._get_scenarios_file(scenario.user_id)
-        scenarios = self._load_json(file_path)
-        
-        scenario_dict = scenario.model_dump()
-        
-        existing_idx = next(
-            (i for i, s in enumerate(scenarios) if s.get("id") == scenario.id),
-            None
-        )
-        
-        if existing_idx is not None:
-            scenarios[existing_idx] = scenario_dict
-        else:
-            scenarios.append(scenario_dict)
-        
-        self._save_json(file_path, scenarios)
+        await asyncio.to_thread(self._append_log, scenario.user_id, "scenarios", scenario.model_dump())
         return scenario.id
     
     async def get_scenario(self, user_id: str, scenario_id: str) -> Optional[SavedScenario]:
-        file_path = self._get_scenarios_file(user_id)
-        scenarios = self._load_json(file_path)
-        
-        for scenario in scenarios:
-            if scenario.get("id") == scenario_id:
-                return SavedScenario(**scenario)
-        return None
+        scenario = (await asyncio.to_thread(self._read_log, user_id, "scenarios")).get(scenario_id)
+        return SavedScenario(**scenario) if scenario else None
     
-    async def list_scenarios(self, user_id: str) -> List[SavedScenario]:
-        file_path = self._get_scenarios_file(user_id)
-        scenarios = self._load_json(file_path)
-        
-        # Sort by created_at descending
-        scenarios.sort(key=lambda s: s.get("created_at", ""), reverse=True)
-        return [SavedScenario(**s) for s in scenarios]
+    async def list_scenarios(self, user_id: str, limit: Optional[int] = None) -> List[SavedScenario]:
+        scenarios = (await asyncio.to_thread(self._read_log, user_id, "scenarios")).values()
+        return _SCENARIO_LIST.validate_python(_newest(scenarios, "created_at", limit))
+
     
     async def delete_scenario(self, user_id: str, scenario_id: str) -> bool:
-        file_path = self._get_scenarios_file(user_id)
-        scenarios = self._load_json(file_path)
-        
-        original_len = len(scenarios)
-        scenarios = [s for s in scenarios if s.get("id") != scenario_id]
-        
-        if len(scenarios) < original_len:
-            self._save_json(file_path, scenarios)
-            return True
-        return False
+        return await asyncio.to_thread(self._delete_from_log, user_id, "scenarios", scenario_id)
 
     # ── Scenario Shares / Consent ──
 
     async def save_scenario_share(self, record: ScenarioShareRecord) -> str:
-        file_path = self._get_scenario_shares_file(record.user_id)
-        records = self._load_json(file_path)
-
-        record.updated_at = datetime.utcnow().isoformat()
-        record_dict = record.model_dump()
-
-        existing_idx = next(
-            (i for i, r in enumerate(records) if r.get("id") == record.id),
-            None
-        )
+        ids = await self.save_scenario_shares([record])
+        return ids[0]
 
-        if existing_idx is not None:
-            records[existing_idx] = record_dict
-        else:
-            records.append(record_dict)
+    async def save_scenario_shares(self, records: List[ScenarioShareRecord]) -> List[str]:
+        # Share records carry full analysis payloads; dump and rewrite off the event loop
+        await asyncio.to_thread(self._save_scenario_shares_sync, records)
+        return [r.id for r in records]
 
-        self._save_json(file_path, records)
-        return record.id
+    def _save_scenario_shares_sync(self, records: List[ScenarioShareRecord]) -> None:
+        for user_id, user_records in _group_by_user(records).items():
+            with self._file_lock(user_id, "scenario_shares"):
+                file_path = self._get_scenario_shares_file(user_id)
+                stored = list(self._load_json(file_path))
+                _upsert_share_records(stored, user_records)
+                self._save_json(file_path, stored)
 
     async def list_scenario_shares(
         self,
@@ -293,12 +686,17 @@ class LocalStorage(StorageBackend):
         user_id: Optional[str] = None,
         advisor_id: Optional[str] = None,
         consent_status: Optional[str] = None,
+    ) -> List[ScenarioShareRecord]:
+        return await asyncio.to_thread(self._list_scenario_shares_sync, user_id, advisor_id, consent_status)
+
+    def _list_scenario_shares_sync(
+        self, user_id: Optional[str], advisor_id: Optional[str], consent_status: Optional[str]
     ) -> List[ScenarioShareRecord]:
         user_ids: List[str] = []
         if user_id:
             user_ids = [user_id]
         else:
-            user_ids = [d.name for d in self.data_dir.iterdir() if d.is_dir()]
+            user_ids = self._iter_user_ids()
 
         results: List[ScenarioShareRecord] = []
         for uid in user_ids:
@@ -320,8 +718,224 @@ class LocalStorage(StorageBackend):
         return results
 
 
+# ─── SQLite Storage ──────────────────────────────────────────────────────────
+
+_SQLITE_SCHEMA = """
+CREATE TABLE IF NOT EXISTS conversations (
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    updated_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (user_id, id)
+);
+CREATE INDEX IF NOT EXISTS conversations_by_user ON conversations (user_id, updated_at DESC);
+
+CREATE TABLE IF NOT EXISTS scenarios (
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (user_id, id)
+);
+CREATE INDEX IF NOT EXISTS scenarios_by_user ON scenarios (user_id, created_at DESC);
+
+CREATE TABLE IF NOT EXISTS scenario_shares (
+    user_id TEXT NOT NULL,
+    id TEXT NOT NULL,
+    advisor_id TEXT NOT NULL,
+    consent_status TEXT NOT NULL,
+    created_at TEXT NOT NULL,
+    data TEXT NOT NULL,
+    PRIMARY KEY (user_id, id)
+);
+CREATE INDEX IF NOT EXISTS scenario_shares_by_advisor ON scenario_shares (advisor_id, created_at DESC);
+"""
+
+
+class SQLiteStorage(StorageBackend):
+    """Local SQLite storage backend.
+
+    Every record is one row in ``sage.db`` holding its JSON in a ``data`` column,
+    so a save is a single upsert rather than a rewrite of the user's whole file.
+    """
+
+    def __init__(self, db_path: str = None):
+        if db_path is None:
+            db_path = Path(__file__).parent / "data" / "sage.db"
+        Path(db_path).parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(db_path), check_same_thread=False)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.executescript(_SQLITE_SCHEMA)
+        # One connection shared by the worker threads below
+        self._lock = threading.Lock()
+
+    def _query_sync(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        with self._lock:
+            return self._conn.execute(sql, params).fetchall()
+
+    def _modify_sync(self, sql: str, rows: List[Tuple]) -> int:
+        """Run a write statement once per row in a single transaction. Returns rows changed."""
+        with self._lock, self._conn:
+            return self._conn.executemany(sql, rows).rowcount
+
+    async def _query(self, sql: str, params: Tuple = ()) -> List[Tuple]:
+        return await asyncio.to_thread(self._query_sync, sql, params)
+
+    async def _modify(self, sql: str, rows: List[Tuple]) -> int:
+        return await asyncio.to_thread(self._modify_sync, sql, rows)
+
+    # ── Conversations ──
+
+    async def save_conversation(self, conversation: Conversation) -> str:
+        conversation.updated_at = now_iso()
+        await self._modify(
+            "INSERT INTO conversations (user_id, id, updated_at, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (user_id, id) DO UPDATE SET updated_at = excluded.updated_at, data = excluded.data",
+            [(conversation.user_id, conversation.id, conversation.updated_at, conversation.model_dump_json())],
+        )
+        return conversation.id
+
+    async def get_conversation(self, user_id: str, conversation_id: str) -> Optional[Conversation]:
+        rows = await self._query(
+            "SELECT data FROM conversations WHERE user_id = ? AND id = ?", (user_id, conversation_id)
+        )
+        return Conversation.model_validate_json(rows[0][0]) if rows else None
+
+    async def list_conversations(self, user_id: str, limit: Optional[int] = None) -> List[Conversation]:
+        rows = await self._query(
+            "SELECT data FROM conversations WHERE user_id = ? ORDER BY updated_at DESC LIMIT ?",
+            (user_id, -1 if limit is None else limit),
+        )
+        return [Conversation.model_validate_json(data) for (data,) in rows]
+
+    async def delete_conversation(self, user_id: str, conversation_id: str) -> bool:
+        return await self._modify(
+            "DELETE FROM conversations WHERE user_id = ? AND id = ?", [(user_id, conversation_id)]
+        ) > 0
+
+    # ── Scenarios ──
+
+    async def save_scenario(self, scenario: SavedScenario) -> str:
+        await self._modify(
+            "INSERT INTO scenarios (user_id, id, created_at, data) VALUES (?, ?, ?, ?) "
+            "ON CONFLICT (user_id, id) DO UPDATE SET created_at = excluded.created_at, data = excluded.data",
+            [(scenario.user_id, scenario.id, scenario.created_at, scenario.model_dump_json())],
+        )
+        return scenario.id
+
+    async def get_scenario(self, user_id: str, scenario_id: str) -> Optional[SavedScenario]:
+        rows = await self._query(
+            "SELECT data FROM scenarios WHERE user_id = ? AND id = ?", (user_id, scenario_id)
+        )
+        return SavedScenario.model_validate_json(rows[0][0]) if rows else None
+
+    async def list_scenarios(self, user_id: str, limit: Optional[int] = None) -> List[SavedScenario]:
+        rows = await self._query(
+            "SELECT data FROM scenarios WHERE user_id = ? ORDER BY created_at DESC LIMIT ?",
+            (user_id, -1 if limit is None else limit),
+        )
+        return [SavedScenario.model_validate_json(data) for (data,) in rows]
+
+    async def list_scenarios_page(
+        self, user_id: str, *, after: Optional[str] = None, limit: int = DEFAULT_PAGE_SIZE
+    ) -> Tuple[List[SavedScenario], Optional[str]]:
+        where, params = "user_id = ?", (user_id,)
+        if after:
+            where += " AND (created_at, id) < (?, ?)"
+            params += decode_cursor(after)
+        # Fetch one extra row to learn whether another page exists
+        rows = await self._query(
+            f"SELECT data FROM scenarios WHERE {where} ORDER BY created_at DESC, id DESC LIMIT ?",
+            params + (limit + 1,),
+        )
+        page = [SavedScenario.model_validate_json(data) for (data,) in rows[:limit]]
+        if len(rows) <= limit:
+            return page, None
+        return page, encode_cursor(page[-1].created_at, page[-1].id)
+
+    async def delete_scenario(self, user_id: str, scenario_id: str) -> bool:
+        return await self._modify(
+            "DELETE FROM scenarios WHERE user_id = ? AND id = ?", [(user_id, scenario_id)]
+        ) > 0
+
+    # ── Scenario Shares / Consent ──
+
+    async def save_scenario_share(self, record: ScenarioShareRecord) -> str:
+        ids = await self.save_scenario_shares([record])
+        return ids[0]
+
+    async def save_scenario_shares(self, records: List[ScenarioShareRecord]) -> List[str]:
+        now = now_iso()
+        rows = []
+        for record in records:
+            record.updated_at = now
+            rows.append((
+                record.user_id, record.id, record.advisor_id, record.consent_status,
+                record.created_at, record.model_dump_json(),
+            ))
+        await self._modify(
+            "INSERT INTO scenario_shares (user_id, id, advisor_id, consent_status, created_at, data) "
+            "VALUES (?, ?, ?, ?, ?, ?) "
+            "ON CONFLICT (user_id, id) DO UPDATE SET advisor_id = excluded.advisor_id, "
+            "consent_status = excluded.consent_status, created_at = excluded.created_at, data = excluded.data",
+            rows,
+        )
+        return [r.id for r in records]
+
+    async def list_scenario_shares(
+        self,
+        *,
+        user_id: Optional[str] = None,
+        advisor_id: Optional[str] = None,
+        consent_status: Optional[str] = None,
+    ) -> List[ScenarioShareRecord]:
+        clauses: List[str] = []
+        params: List[str] = []
+        for column, value in (("user_id", user_id), ("advisor_id", advisor_id), ("consent_status", consent_status)):
+            if value:
+                clauses.append(f"{column} = ?")
+                params.append(value)
+        where = f" WHERE {' AND '.join(clauses)}" if clauses else ""
+        rows = await self._query(
+            f"SELECT data FROM scenario_shares{where} ORDER BY created_at DESC", tuple(params)
+        )
+        return [ScenarioShareRecord.model_validate_json(data) for (data,) in rows]
+
+
 # ─── Azure Blob Storage ──────────────────────────────────────────────────────
 
+# Fast levels already get most of the ratio on repetitive JSON
+_BLOB_GZIP_LEVEL = 5
+
+# Read-modify-write retries when another writer changes the blob first
+_BLOB_WRITE_ATTEMPTS = 5
+
+# Receives a copy of a blob's {id: record}; returns the new index, or None to skip the write
+BlobUpdate = Callable[[Dict[str, Dict]], Optional[Dict[str, Dict]]]
+
+
+def _put_record(record: Dict) -> BlobUpdate:
+    def apply(index: Dict[str, Dict]) -> Dict[str, Dict]:
+        # Replacing an existing key keeps its position in the stored array
+        index[record["id"]] = record
+        return index
+    return apply
+
+
+def _remove_record(record_id: str) -> BlobUpdate:
+    def apply(index: Dict[str, Dict]) -> Optional[Dict[str, Dict]]:
+        return index if index.pop(record_id, None) is not None else None
+    return apply
+
+
+def _decode_blob(raw: bytes) -> List[Dict]:
+    """Decode a blob body, gunzipping it unless it was stored (or delivered) as plain JSON."""
+    if raw[:2] == b"\x1f\x8b":
+        raw = gzip.decompress(raw)
+    return orjson.loads(raw)
+
+
 class AzureBlobStorage(StorageBackend):
     """Azure Blob Storage backend."""
     
@@ -330,6 +944,8 @@ class AzureBlobStorage(StorageBackend):
         self.container_name = container_name
         self._client = None
         self._container = None
+        # Decoded blobs keyed by (user_id, data_type), validated by ETag
+        self._cache = _DecodedCache()
     
     def _get_client(self):
         """Lazy initialization of blob client."""
@@ -349,138 +965,149 @@ class AzureBlobStorage(StorageBackend):
     
     def _get_blob_path(self, user_id: str, data_type: str) -> str:
         """Get blob path for user data."""
+        return f"{_shard_path(user_id)}/{data_type}.json"
+
+    def _get_legacy_blob_path(self, user_id: str, data_type: str) -> str:
+        """Blob path used before user data was sharded; still read until the next write."""
         return f"{user_id}/{data_type}.json"
     
     async def _load_blob(self, user_id: str, data_type: str) -> List[Dict]:
         """Load JSON array from blob."""
+        return list(self._read_blob_index(user_id, data_type).values())
+
+    async def _load_blob_index(self, user_id: str, data_type: str) -> Dict[str, Dict]:
+        """Load a blob as {id: record}. The result is cached; copy before mutating."""
+        return self._read_blob_index(user_id, data_type)
+
+    def _read_blob_index(self, user_id: str, data_type: str) -> Dict[str, Dict]:
+        """Download and decode a blob into {id: record} in stored order.
+
+        The decoded index is reused while the blob's ETag is unchanged.
+        """
+        from azure.core import MatchConditions
+        from azure.core.exceptions import ResourceNotFoundError, ResourceNotModifiedError
+
         container = self._get_client()
-        blob_path = self._get_blob_path(user_id, data_type)
-        
+        key = (user_id, data_type)
+        entry = self._cache.peek(key)
         try:
-            blob_client = container.get_blob_client(blob_path)
-            data = blob_client.download_blob().readall()
-            return json.loads(data)
+            blob_client = container.get_blob_client(self._get_blob_path(user_id, data_type))
+            if entry is not None:
+                downloader = blob_client.download_blob(etag=entry[0], match_condition=MatchConditions.IfModified)
+            else:
+                downloader = blob_client.download_blob()
+            index = {d.get("id"): d for d in _decode_blob(downloader.readall())}
+            self._cache.put(key, downloader.properties.etag, index)
+            return index
+        except ResourceNotModifiedError:
+            return entry[1]
+        except ResourceNotFoundError:
+            self._cache.pop(key)
         except Exception:
-            return []
+            return {}
+
+        try:
+            blob_client = container.get_blob_client(self._get_legacy_blob_path(user_id, data_type))
+            return {d.get("id"): d for d in _decode_blob(blob_client.download_blob().readall())}
+        except Exception:
+            return {}
     
-    async def _save_blob(self, user_id: str, data_type: str, data: List[Dict]) -> None:
-        """Save JSON array to blob."""
+    def _write_blob(self, user_id: str, data_type: str, data: List[Dict], etag: Optional[str]) -> None:
+        """Upload a blob only if it is still at ``etag`` (or still absent when ``etag`` is None)."""
+        from azure.core import MatchConditions
+        from azure.storage.blob import ContentSettings
+
         container = self._get_client()
         blob_path = self._get_blob_path(user_id, data_type)
         
         blob_client = container.get_blob_client(blob_path)
-        blob_client.upload_blob(
-            json.dumps(data, indent=2, ensure_ascii=False),
-            overwrite=True
+        result = blob_client.upload_blob(
+            gzip.compress(orjson.dumps(data, option=_ORJSON_OPTS), compresslevel=_BLOB_GZIP_LEVEL),
+            overwrite=True,
+            content_settings=ContentSettings(content_type="application/json", content_encoding="gzip"),
+            etag=etag,
+            match_condition=MatchConditions.IfNotModified if etag else MatchConditions.IfMissing,
         )
+        self._cache.put((user_id, data_type), result["etag"], {d.get("id"): d for d in data})
+
+    def _update_blob(self, user_id: str, data_type: str, update: BlobUpdate) -> bool:
+        """Read-modify-write a blob, retrying when another writer got there first.
+
+        Returns False if ``update`` declined to change anything.
+        """
+        from azure.core.exceptions import ResourceExistsError, ResourceModifiedError
+
+        key = (user_id, data_type)
+        for _ in range(_BLOB_WRITE_ATTEMPTS):
+            index = self._read_blob_index(user_id, data_type)
+            entry = self._cache.peek(key)
+            # Only trust the cached ETag if it describes the index just read
+            etag = entry[0] if entry is not None and entry[1] is index else None
+            updated = update(dict(index))
+            if updated is None:
+                return False
+            try:
+                self._write_blob(user_id, data_type, list(updated.values()), etag)
+                return True
+            except (ResourceModifiedError, ResourceExistsError):
+                self._cache.pop(key)
+        raise RuntimeError(f"Could not update {data_type} for {user_id}: blob kept changing")
     
     # ── Conversations ──
     
     async def save_conversation(self, conversation: Conversation) -> str:
-        conversations = await self._load_blob(conversation.user_id, "conversations")
-        
-        conversation.updated_at = datetime.utcnow().isoformat()
-        conv_dict = conversation.model_dump()
-        
-        existing_idx = next(
-            (i for i, c in enumerate(conversations) if c.get("id") == conversation.id),
-            None
-        )
-        
-        if existing_idx is not None:
-            conversations[existing_idx] = conv_dict
-        else:
-            conversations.append(conv_dict)
-        
-        await self._save_blob(conversation.user_id, "conversations", conversations)
+        conversation.updated_at = now_iso()
+        self._update_blob(conversation.user_id, "conversations", _put_record(conversation.model_dump()))
         return conversation.id
     
     async def get_conversation(self, user_id: str, conversation_id: str) -> Optional[Conversation]:
-        conversations = await self._load_blob(user_id, "conversations")
-        
-        for conv in conversations:
-            if conv.get("id") == conversation_id:
-                return Conversation(**conv)
-        return None
+        conv = (await self._load_blob_index(user_id, "conversations")).get(conversation_id)
+        return Conversation(**conv) if conv else None
     
-    async def list_conversations(self, user_id: str) -> List[Conversation]:
-        conversations = await self._load_blob(user_id, "conversations")
-        conversations.sort(key=lambda c: c.get("updated_at", ""), reverse=True)
-        return [Conversation(**c) for c in conversations]
+    async def list_conversations(self, user_id: str, limit: Optional[int] = None) -> List[Conversation]:
+        conversations = (await self._load_blob_index(user_id, "conversations")).values()
+        return _CONVERSATION_LIST.validate_python(_newest(conversations, "updated_at", limit))
     
     async def delete_conversation(self, user_id: str, conversation_id: str) -> bool:
-        conversations = await self._load_blob(user_id, "conversations")
-        original_len = len(conversations)
-        conversations = [c for c in conversations if c.get("id") != conversation_id]
-        
-        if len(conversations) < original_len:
-            await self._save_blob(user_id, "conversations", conversations)
-            return True
-        return False
+        return self._update_blob(user_id, "conversations", _remove_record(conversation_id))
     
     # ── Scenarios ──
     
     async def save_scenario(self, scenario: SavedScenario) -> str:
-        scenarios = await self._load_blob(scenario.user_id, "scenarios")
-        
-        scenario_dict = scenario.model_dump()
-        
-        existing_idx = next(
-            (i for i, s in enumerate(scenarios) if s.get("id") == scenario.id),
-            None
-        )
-        
-        if existing_idx is not None:
-            scenarios[existing_idx] = scenario_dict
-        else:
-            scenarios.append(scenario_dict)
-        
-        await self._save_blob(scenario.user_id, "scenarios", scenarios)
+        self._update_blob(scenario.user_id, "scenarios", _put_record(scenario.model_dump()))
         return scenario.id
     
     async def get_scenario(self, user_id: str, scenario_id: str) -> Optional[SavedScenario]:
-        scenarios = await self._load_blob(user_id, "scenarios")
-        
-        for scenario in scenarios:
-            if scenario.get("id") == scenario_id:
-                return SavedScenario(**scenario)
-        return None
+        scenario = (await self._load_blob_index(user_id, "scenarios")).get(scenario_id)
+        return SavedScenario(**scenario) if scenario else None
     
-    async def list_scenarios(self, user_id: str) -> List[SavedScenario]:
-        scenarios = await self._load_blob(user_id, "scenarios")
-        scenarios.sort(key=lambda s: s.get("created_at", ""), reverse=True)
-        return [SavedScenario(**s) for s in scenarios]
+    async def list_scenarios(self, user_id: str, limit: Optional[int] = None) -> List[SavedScenario]:
+        scenarios = (await self._load_blob_index(user_id, "scenarios")).values()
+        return _SCENARIO_LIST.validate_python(_newest(scenarios, "created_at", limit))
+
     
     async def delete_scenario(self, user_id: str, scenario_id: str) -> bool:
-        scenarios = await self._load_blob(user_id, "scenarios")
-        original_len = len(scenarios)
-        scenarios = [s for s in scenarios if s.get("id") != scenario_id]
-        
-        if len(scenarios) < original_len:
-            await self._save_blob(user_id, "scenarios", scenarios)
-            return True
-        return False
+        return self._update_blob(user_id, "scenarios", _remove_record(scenario_id))
 
     # ── Scenario Shares / Consent ──
 
     async def save_scenario_share(self, record: ScenarioShareRecord) -> str:
-        records = await self._load_blob(record.user_id, "scenario_shares")
+        ids = await self.save_scenario_shares([record])
+        return ids[0]
 
-        record.updated_at = datetime.utcnow().isoformat()
-        record_dict = record.model_dump()
+    async def save_scenario_shares(self, records: List[ScenarioShareRecord]) -> List[str]:
+        # Share records carry full analysis payloads; dump and upload off the event loop
+        await asyncio.to_thread(self._save_scenario_shares_sync, records)
+        return [r.id for r in records]
 
-        existing_idx = next(
-            (i for i, r in enumerate(records) if r.get("id") == record.id),
-            None
-        )
+    def _save_scenario_shares_sync(self, records: List[ScenarioShareRecord]) -> None:
+        for user_id, user_records in _group_by_user(records).items():
+            def apply(index: Dict[str, Dict], user_records=user_records) -> Dict[str, Dict]:
+                stored = list(index.values())
+                _upsert_share_records(stored, user_records)
+                return {d.get("id"): d for d in stored}
 
-        if existing_idx is not None:
-            records[existing_idx] = record_dict
-        else:
-            records.append(record_dict)
-
-        await self._save_blob(record.user_id, "scenario_shares", records)
-        return record.id
+            self._update_blob(user_id, "scenario_shares", apply)
 
     async def list_scenario_shares(
         self,
@@ -516,11 +1143,15 @@ def get_storage_backend() -> StorageBackend:
     """
     Get the configured storage backend.
     
-    Set STORAGE_BACKEND=azure to use Azure Blob Storage.
+    Set STORAGE_BACKEND=azure to use Azure Blob Storage, or
+    STORAGE_BACKEND=sqlite for a local SQLite database.
     Default is local JSON storage.
     """
     backend_type = os.environ.get("STORAGE_BACKEND", "local").lower()
     
+    if backend_type == "sqlite":
+        return SQLiteStorage()
+    
     if backend_type == "azure":
         connection_string = os.environ.get("AZURE_STORAGE_CONNECTION_STRING")
         if not connection_string:
@@ -531,5 +1162,7 @@ def get_storage_backend() -> StorageBackend:
     return LocalStorage()
 
 
-# Global storage instance
-storage = get_storage_backend()
+@lru_cache(maxsize=None)
+def get_storage() -> StorageBackend:
+    """Process-wide storage backend, created on first use."""
+    return get_storage_backend()
@@ -0,0 +1,41 @@
+from citations import MAX_CITATION_TOKEN_LEN, StreamingCitationExtractor
+
+RULES = {
+    "us-401k-limit-2026": {"title": "401(k) Contribution Limit 2026", "jurisdiction": "US"},
+    "ca-tfsa-limit-2026": {"title": "TFSA Contribution Limit 2026", "jurisdiction": "CA"},
+}
+
+TEXT = (
+    "You can defer up to the limit [REF:us-401k-limit-2026]. In Canada, see "
+    "[REF:ca-tfsa-limit-2026]; the 401(k) limit [REF:us-401k-limit-2026] still "
+    "applies, but [REF:made-up-rule] does not exist."
+)
+
+
+def _stream(text: str, size: int) -> StreamingCitationExtractor:
+    extractor = StreamingCitationExtractor(rules_map=RULES)
+    for i in range(0, len(text), size):
+        extractor.feed(text[i:i + size])
+    return extractor
+
+
+def test_markers_split_across_chunks_are_found_once_in_order():
+    for size in range(1, 40):
+        extractor = _stream(TEXT, size)
+        assert [c["id"] for c in extractor.citations] == ["us-401k-limit-2026", "ca-tfsa-limit-2026"], size
+
+
+def test_feed_returns_only_newly_seen_known_rules():
+    extractor = StreamingCitationExtractor(rules_map=RULES)
+    assert extractor.feed("see [REF:us-401k-") == []
+    (citation,) = extractor.feed("limit-2026] and [REF:made-up-rule]")
+    assert citation["title"] == "401(k) Contribution Limit 2026"
+    assert extractor.feed(" again [REF:us-401k-limit-2026]") == []
+
+
+def test_tail_is_bounded():
+    extractor = StreamingCitationExtractor(rules_map=RULES)
+    extractor.feed("x" * 10_000)
+    assert len(extractor._tail) == MAX_CITATION_TOKEN_LEN
+    extractor.feed("[REF:ca-tfsa-limit-2026]")
+    assert [c["id"] for c in extractor.citations] == ["ca-tfsa-limit-2026"]
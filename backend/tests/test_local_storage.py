@@ -0,0 +1,160 @@
+import asyncio
+import json
+from pathlib import Path
+
+import pytest
+from pydantic import ValidationError
+
+from storage import Conversation, ConversationMessage, LocalStorage, SavedScenario, ScenarioShareRecord, _shard_path
+
+
+def _scenario(name: str, created_at: str) -> SavedScenario:
+    return SavedScenario(
+        user_id="demo-user",
+        name=name,
+        description="What if I retire early?",
+        timeframe_months=12,
+        projection_result={"projection": {"total_change_percent": 4.2}},
+        created_at=created_at,
+    )
+
+
+def test_conversation_updates_and_deletes_append_to_log(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+
+    conversation = Conversation(user_id="demo-user", title="Retirement plan")
+    asyncio.run(storage.save_conversation(conversation))
+    conversation.messages.append(ConversationMessage(role="user", content="Can I retire at 60?"))
+    asyncio.run(storage.save_conversation(conversation))
+
+    log = tmp_path / "user_data" / _shard_path("demo-user") / "conversations.jsonl"
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 2
+
+    loaded = asyncio.run(storage.get_conversation("demo-user", conversation.id))
+    assert [m.content for m in loaded.messages] == ["Can I retire at 60?"]
+    assert len(asyncio.run(storage.list_conversations("demo-user"))) == 1
+
+    assert asyncio.run(storage.delete_conversation("demo-user", conversation.id))
+    assert not asyncio.run(storage.delete_conversation("demo-user", conversation.id))
+    assert asyncio.run(storage.get_conversation("demo-user", conversation.id)) is None
+    assert asyncio.run(storage.list_conversations("demo-user")) == []
+
+
+def test_legacy_json_array_is_converted(tmp_path: Path):
+    user_dir = tmp_path / "user_data" / "demo-user"
+    user_dir.mkdir(parents=True)
+    legacy = _scenario("Legacy", "2025-06-01T00:00:00").model_dump()
+    (user_dir / "scenarios.json").write_text(json.dumps([legacy]), encoding="utf-8")
+
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    scenarios = asyncio.run(storage.list_scenarios("demo-user"))
+
+    assert [s.name for s in scenarios] == ["Legacy"]
+    sharded_dir = tmp_path / "user_data" / _shard_path("demo-user")
+    assert not user_dir.exists()
+    assert not (sharded_dir / "scenarios.json").exists()
+    assert (sharded_dir / "scenarios.jsonl").exists()
+
+
+def test_log_is_compacted_when_mostly_superseded(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    scenario = _scenario("Retire at 62", "2026-01-01T00:00:00")
+    for i in range(40):
+        scenario.name = f"Retire at 62 (rev {i})"
+        asyncio.run(storage.save_scenario(scenario))
+
+    log = tmp_path / "user_data" / _shard_path("demo-user") / "scenarios.jsonl"
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 40
+
+    loaded = asyncio.run(storage.get_scenario("demo-user", scenario.id))
+    assert loaded.name == "Retire at 62 (rev 39)"
+    assert len(log.read_text(encoding="utf-8").splitlines()) == 1
+
+
+def test_cached_reads_see_writes_from_another_instance(tmp_path: Path):
+    first = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    second = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    scenario = _scenario("Retire at 62", "2026-01-01T00:00:00")
+    asyncio.run(first.save_scenario(scenario))
+    assert asyncio.run(first.get_scenario("demo-user", scenario.id)).name == "Retire at 62"
+
+    scenario.name = "Retire at 65"
+    asyncio.run(second.save_scenario(scenario))
+    assert asyncio.run(first.get_scenario("demo-user", scenario.id)).name == "Retire at 65"
+
+    asyncio.run(first.delete_scenario("demo-user", scenario.id))
+    assert asyncio.run(first.list_scenarios("demo-user")) == []
+    assert asyncio.run(second.list_scenarios("demo-user")) == []
+
+
+def test_rewrites_leave_no_temp_files(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    record = ScenarioShareRecord(
+        user_id="demo-user",
+        advisor_id="advisor-jane",
+        scenario_description="Retire at 62",
+        consent_status="accepted",
+    )
+    asyncio.run(storage.save_scenario_shares([record]))
+    asyncio.run(storage.save_scenario_shares([record]))
+
+    user_dir = tmp_path / "user_data" / _shard_path("demo-user")
+    assert sorted(p.name for p in user_dir.iterdir()) == ["scenario_shares.json"]
+    assert [r.id for r in asyncio.run(storage.list_scenario_shares(user_id="demo-user"))] == [record.id]
+
+
+def test_list_limit_returns_newest(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    for day in (3, 1, 5, 2, 4):
+        asyncio.run(storage.save_scenario(_scenario(f"Day {day}", f"2026-01-0{day}T00:00:00")))
+
+    newest = asyncio.run(storage.list_scenarios("demo-user", limit=2))
+    assert [s.name for s in newest] == ["Day 5", "Day 4"]
+    assert len(asyncio.run(storage.list_scenarios("demo-user"))) == 5
+
+
+def test_new_messages_are_appended_to_their_own_log(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    conversation = Conversation(user_id="demo-user", title="Retirement plan")
+    for i in range(3):
+        conversation.messages.append(ConversationMessage(role="user", content=f"Question {i}"))
+        asyncio.run(storage.save_conversation(conversation))
+
+    messages_log = tmp_path / "user_data" / _shard_path("demo-user") / "messages" / f"{conversation.id}.jsonl"
+    assert len(messages_log.read_text(encoding="utf-8").splitlines()) == 3
+    conversations_log = tmp_path / "user_data" / _shard_path("demo-user") / "conversations.jsonl"
+    assert "\"messages\"" not in conversations_log.read_text(encoding="utf-8")
+
+    conversation.messages[0].content = "Edited"
+    asyncio.run(storage.save_conversation(conversation))
+    reloaded = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    loaded = asyncio.run(reloaded.get_conversation("demo-user", conversation.id))
+    assert [m.content for m in loaded.messages] == ["Edited", "Question 1", "Question 2"]
+
+    (summary,) = asyncio.run(reloaded.list_conversation_summaries("demo-user"))
+    assert (summary.message_count, summary.last_message.content) == (3, "Question 2")
+
+    assert asyncio.run(reloaded.delete_conversation("demo-user", conversation.id))
+    assert not messages_log.exists()
+
+
+def test_appends_do_not_mutate_dicts_already_handed_out(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+    first = _scenario("Retire at 62", "2026-01-01T00:00:00")
+    asyncio.run(storage.save_scenario(first))
+    snapshot = storage._read_log("demo-user", "scenarios")
+
+    asyncio.run(storage.save_scenario(_scenario("Retire at 65", "2026-01-02T00:00:00")))
+    asyncio.run(storage.delete_scenario("demo-user", first.id))
+
+    assert list(snapshot) == [first.id]
+    assert [s.name for s in asyncio.run(storage.list_scenarios("demo-user"))] == ["Retire at 65"]
+
+
+def test_malformed_projection_result_is_a_validation_error():
+    fields = dict(user_id="demo-user", name="Bad", description="Bad", timeframe_months=12)
+    for bad in ([1, 2], "oops"):
+        with pytest.raises(ValidationError):
+            SavedScenario(projection_result=bad, **fields)
+    scenario = SavedScenario(projection_result={"projection": "n/a"}, **fields)
+    assert scenario.total_change_percent == 0.0
@@ -1,6 +1,10 @@
 import asyncio
+from datetime import datetime
 from pathlib import Path
 
+import pytest
+
+from ids import now_iso
 from storage import LocalStorage, ScenarioShareRecord
 
 
@@ -38,3 +42,96 @@ def test_save_and_filter_scenario_shares(tmp_path: Path):
     all_for_user = asyncio.run(storage.list_scenario_shares(user_id="demo-user"))
     assert len(all_for_user) == 2
     assert {record.consent_status for record in all_for_user} == {"accepted", "rejected"}
+
+
+def test_save_scenario_shares_batches_per_user(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+
+    first = ScenarioShareRecord(
+        user_id="demo-user",
+        advisor_id="advisor-jane",
+        scenario_description="Retire at 62",
+        consent_status="accepted",
+    )
+    second = ScenarioShareRecord(
+        user_id="other-user",
+        advisor_id="advisor-jane",
+        scenario_description="Buy a cottage",
+        consent_status="accepted",
+    )
+    ids = asyncio.run(storage.save_scenario_shares([first, second]))
+    assert ids == [first.id, second.id]
+
+    # Re-saving an existing record updates it in place
+    first.consent_status = "rejected"
+    asyncio.run(storage.save_scenario_shares([first]))
+
+    demo_records = asyncio.run(storage.list_scenario_shares(user_id="demo-user"))
+    assert [(r.id, r.consent_status) for r in demo_records] == [(first.id, "rejected")]
+    assert len(asyncio.run(storage.list_scenario_shares(user_id="other-user"))) == 1
+
+
+def test_list_scenario_shares_page_follows_cursor(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+
+    records = [
+        ScenarioShareRecord(
+            user_id="demo-user",
+            advisor_id="advisor-jane",
+            scenario_description=f"Scenario {i}",
+            consent_status="accepted",
+            created_at=f"2026-01-0{i + 1}T00:00:00",
+        )
+        for i in range(5)
+    ]
+    asyncio.run(storage.save_scenario_shares(records))
+
+    seen = []
+    cursor = None
+    while True:
+        page, cursor = asyncio.run(
+            storage.list_scenario_shares_page(user_id="demo-user", after=cursor, limit=2)
+        )
+        seen.extend(r.scenario_description for r in page)
+        if cursor is None:
+            break
+    assert seen == [f"Scenario {i}" for i in reversed(range(5))]
+
+    with pytest.raises(ValueError):
+        asyncio.run(storage.list_scenario_shares_page(user_id="demo-user", after="not-a-cursor"))
+
+
+def test_list_scenario_shares_page_cursor_survives_writes(tmp_path: Path):
+    storage = LocalStorage(data_dir=str(tmp_path / "user_data"))
+
+    def share(description: str, created_at: str) -> ScenarioShareRecord:
+        return ScenarioShareRecord(
+            user_id="demo-user",
+            advisor_id="advisor-jane",
+            scenario_description=description,
+            consent_status="accepted",
+            created_at=created_at,
+        )
+
+    records = [share(f"Scenario {i}", "2026-01-01T00:00:00") for i in range(5)]
+    asyncio.run(storage.save_scenario_shares(records))
+
+    first, cursor = asyncio.run(storage.list_scenario_shares_page(user_id="demo-user", limit=2))
+    asyncio.run(storage.save_scenario_shares([share("Newer", "2026-02-01T00:00:00")]))
+    first[0].consent_status = "rejected"
+    asyncio.run(storage.save_scenario_shares([first[0]]))
+    rest, end = asyncio.run(
+        storage.list_scenario_shares_page(
+            user_id="demo-user", consent_status="accepted", after=cursor, limit=5
+        )
+    )
+
+    assert sorted(r.id for r in first + rest) == sorted(r.id for r in records)
+    assert end is None
+
+
+def test_now_iso_matches_datetime_isoformat():
+    stamp = now_iso()
+    parsed = datetime.fromisoformat(stamp)
+    assert stamp == parsed.isoformat(timespec="microseconds")
+    assert abs((datetime.utcnow() - parsed).total_seconds()) < 1
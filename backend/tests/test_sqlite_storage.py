@@ -0,0 +1,75 @@
+import asyncio
+from pathlib import Path
+
+from storage import Conversation, SavedScenario, ScenarioShareRecord, SQLiteStorage
+
+
+def _scenario(name: str, created_at: str) -> SavedScenario:
+    return SavedScenario(
+        user_id="demo-user",
+        name=name,
+        description="What if I retire early?",
+        timeframe_months=12,
+        projection_result={"projection": {"total_change_percent": 4.2}},
+        created_at=created_at,
+    )
+
+
+def test_conversation_round_trip_and_delete(tmp_path: Path):
+    storage = SQLiteStorage(db_path=str(tmp_path / "sage.db"))
+    conversation = Conversation(user_id="demo-user", title="Retirement plan")
+    asyncio.run(storage.save_conversation(conversation))
+    conversation.title = "Retire at 60"
+    asyncio.run(storage.save_conversation(conversation))
+
+    loaded = asyncio.run(storage.list_conversations("demo-user"))
+    assert [c.title for c in loaded] == ["Retire at 60"]
+
+    assert asyncio.run(storage.delete_conversation("demo-user", conversation.id))
+    assert not asyncio.run(storage.delete_conversation("demo-user", conversation.id))
+    assert asyncio.run(storage.get_conversation("demo-user", conversation.id)) is None
+
+
+def test_scenario_pages_are_newest_first(tmp_path: Path):
+    storage = SQLiteStorage(db_path=str(tmp_path / "sage.db"))
+    for i in range(5):
+        asyncio.run(storage.save_scenario(_scenario(f"Scenario {i}", f"2026-01-0{i + 1}T00:00:00")))
+
+    first, cursor = asyncio.run(storage.list_scenarios_page("demo-user", limit=3))
+    second, end = asyncio.run(storage.list_scenarios_page("demo-user", after=cursor, limit=3))
+
+    assert [s.name for s in first + second] == [f"Scenario {i}" for i in range(4, -1, -1)]
+    assert end is None
+
+
+def test_scenario_pages_survive_writes_between_requests(tmp_path: Path):
+    storage = SQLiteStorage(db_path=str(tmp_path / "sage.db"))
+    # Equal timestamps, so the page order falls back to the id
+    scenarios = [_scenario(f"Scenario {i}", "2026-01-01T00:00:00") for i in range(5)]
+    for s in scenarios:
+        asyncio.run(storage.save_scenario(s))
+
+    first, cursor = asyncio.run(storage.list_scenarios_page("demo-user", limit=2))
+    asyncio.run(storage.save_scenario(_scenario("Newer", "2026-02-01T00:00:00")))
+    asyncio.run(storage.delete_scenario("demo-user", first[0].id))
+    rest, end = asyncio.run(storage.list_scenarios_page("demo-user", after=cursor, limit=5))
+
+    assert sorted(s.id for s in first + rest) == sorted(s.id for s in scenarios)
+    assert end is None
+
+
+def test_scenario_shares_filter_by_advisor(tmp_path: Path):
+    storage = SQLiteStorage(db_path=str(tmp_path / "sage.db"))
+    records = [
+        ScenarioShareRecord(
+            user_id=f"client-{i}",
+            advisor_id="advisor-a" if i % 2 else "advisor-b",
+            scenario_description="Retire at 62",
+            consent_status="accepted",
+        )
+        for i in range(4)
+    ]
+    asyncio.run(storage.save_scenario_shares(records))
+
+    shares = asyncio.run(storage.list_scenario_shares(advisor_id="advisor-a", consent_status="accepted"))
+    assert sorted(r.user_id for r in shares) == ["client-1", "client-3"]
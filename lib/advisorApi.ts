@@ -174,12 +174,19 @@ export async function getClientSharedScenarios(
     })
   }
 
-  const response = await fetch(`${API_BASE_URL}/api/shared-scenarios/${advisorId}/${clientId}`)
-  if (!response.ok) {
-    throw new Error(`Failed to fetch shared scenarios: ${response.statusText}`)
-  }
-  const data = await response.json()
-  return data.scenarios || []
+  const scenarios: AdvisorSharedScenario[] = []
+  let cursor: string | null = null
+  do {
+    const query: string = cursor ? `?cursor=${encodeURIComponent(cursor)}` : ""
+    const response = await fetch(`${API_BASE_URL}/api/shared-scenarios/${advisorId}/${clientId}${query}`)
+    if (!response.ok) {
+      throw new Error(`Failed to fetch shared scenarios: ${response.statusText}`)
+    }
+    const data = await response.json()
+    scenarios.push(...(data.scenarios || []))
+    cursor = data.next_cursor ?? null
+  } while (cursor)
+  return scenarios
 }
 
 export function getMockScenarioShareEscalations(advisorId: string): EscalationTicket[] {
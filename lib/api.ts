@@ -731,10 +731,17 @@ export const listSavedScenarios = async (userId: string): Promise<SavedScenarioS
   }
 
   try {
-    const response = await makeApiCall(`/api/saved-scenarios/${userId}`)
-    if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`)
-    const data = await response.json()
-    return data.scenarios || []
+    const scenarios: SavedScenarioSummary[] = []
+    let cursor: string | null = null
+    do {
+      const query: string = cursor ? `?cursor=${encodeURIComponent(cursor)}` : ""
+      const response = await makeApiCall(`/api/saved-scenarios/${userId}${query}`)
+      if (!response.ok) throw new Error(`HTTP error! status: ${response.status}`)
+      const data = await response.json()
+      scenarios.push(...(data.scenarios || []))
+      cursor = data.next_cursor ?? null
+    } while (cursor)
+    return scenarios
   } catch (error) {
     console.error("Failed to list scenarios:", error)
     return []
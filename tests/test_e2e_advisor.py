@@ -10,14 +10,16 @@ Tests all phases of the implementation including:
 - Phase 7: Advisor Chat & Regulatory
 - Phase 8-10: Admin Features
 
-Run with: python tests/test_e2e_advisor.py
+Run with: python -m pytest tests/test_e2e_advisor.py
 """
 
 import sys
 import os
+import asyncio
 import unittest
 import json
 from datetime import datetime, timedelta
+from functools import lru_cache
 from pathlib import Path
 
 # Add backend to path
@@ -49,11 +51,42 @@ from models import (
 from advisor_storage import AdvisorStorage
 
 
+DATA_DIR = Path(__file__).resolve().parent.parent / "backend" / "data"
+
+# Timestamps only need to be well-formed here, so take the clock once
+_NOW_DT = datetime.utcnow()
+_NOW = _NOW_DT.isoformat()
+
+# One event loop for the whole module instead of a fresh one per asyncio.run()
+_loop = None
+
+
+def setUpModule():
+    global _loop
+    _loop = asyncio.new_event_loop()
+
+
+def tearDownModule():
+    _loop.close()
+
+
+def _run(coro):
+    return _loop.run_until_complete(coro)
+
+
+@lru_cache(maxsize=None)
+def _load_json(path: str):
+    """Parse a data file once per run; tests only read the result."""
+    with open(path) as f:
+        return json.load(f)
+
+
 class TestPhase1Foundation(unittest.TestCase):
     """Phase 1: Foundation & Mode Toggle Tests"""
     
-    def setUp(self):
-        self.storage = AdvisorStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = AdvisorStorage()
     
     def test_advisor_profile_model(self):
         """Test AdvisorProfile model creation"""
@@ -66,8 +99,8 @@ class TestPhase1Foundation(unittest.TestCase):
             jurisdictions=["US", "CA"],
             specializations=["retirement_planning"],
             bio="Test bio",
-            created_at=datetime.utcnow().isoformat(),
-            updated_at=datetime.utcnow().isoformat(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         self.assertEqual(advisor.role, "advisor")
         self.assertIn("US", advisor.jurisdictions)
@@ -81,8 +114,8 @@ class TestPhase1Foundation(unittest.TestCase):
             name="Test Admin",
             role="admin",
             permissions=["manage_products", "review_compliance"],
-            created_at=datetime.utcnow().isoformat(),
-            updated_at=datetime.utcnow().isoformat(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         self.assertEqual(admin.role, "admin")
         self.assertIn("manage_products", admin.permissions)
@@ -107,8 +140,8 @@ class TestPhase1Foundation(unittest.TestCase):
             jurisdiction="US",
             escalation_enabled=True,
             status="healthy",
-            created_at=datetime.utcnow().isoformat(),
-            updated_at=datetime.utcnow().isoformat(),
+            created_at=_NOW,
+            updated_at=_NOW,
         )
         self.assertEqual(client.advisor_id, "test-advisor")
         self.assertEqual(client.jurisdiction, Jurisdiction.US)
@@ -118,20 +151,19 @@ class TestPhase1Foundation(unittest.TestCase):
 class TestPhase2Dashboard(unittest.TestCase):
     """Phase 2: Advisor Dashboard & Client List Tests"""
     
-    def setUp(self):
-        self.storage = AdvisorStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = AdvisorStorage()
     
     def test_get_advisor_by_id(self):
         """Test retrieving advisor by ID"""
-        import asyncio
-        advisor = asyncio.run(self.storage.get_advisor("advisor-jane"))
+        advisor = _run(self.storage.get_advisor("advisor-jane"))
         self.assertIsNotNone(advisor)
         self.assertEqual(advisor.name, "Jane Smith")
     
     def test_get_clients_for_advisor(self):
         """Test retrieving clients assigned to advisor"""
-        import asyncio
-        clients = asyncio.run(self.storage.get_clients_for_advisor("advisor-jane"))
+        clients = _run(self.storage.get_clients_for_advisor("advisor-jane"))
         self.assertIsInstance(clients, list)
         # Verify all clients belong to this advisor
         for client in clients:
@@ -139,8 +171,7 @@ class TestPhase2Dashboard(unittest.TestCase):
     
     def test_dashboard_metrics_calculation(self):
         """Test dashboard metrics are calculated correctly"""
-        import asyncio
-        metrics = asyncio.run(self.storage.get_advisor_dashboard_metrics("advisor-jane"))
+        metrics = _run(self.storage.get_advisor_dashboard_metrics("advisor-jane"))
         
         self.assertIn("total_aum", metrics)
         self.assertIn("client_count", metrics)
@@ -159,13 +190,13 @@ class TestPhase2Dashboard(unittest.TestCase):
 class TestPhase3ClientDetail(unittest.TestCase):
     """Phase 3: Client Detail & AI Summary Tests"""
     
-    def setUp(self):
-        self.storage = AdvisorStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = AdvisorStorage()
     
     def test_get_client_detail(self):
         """Test retrieving detailed client profile"""
-        import asyncio
-        client = asyncio.run(self.storage.get_client("demo-user"))
+        client = _run(self.storage.get_client("demo-user"))
         self.assertIsNotNone(client)
         self.assertEqual(client.name, "John Doe")
         self.assertIsNotNone(client.portfolio)
@@ -175,8 +206,9 @@ class TestPhase3ClientDetail(unittest.TestCase):
 class TestPhase4Notes(unittest.TestCase):
     """Phase 4: Advisor Notes Tests"""
     
-    def setUp(self):
-        self.storage = AdvisorStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = AdvisorStorage()
     
     def test_note_model_creation(self):
         """Test AdvisorNote model"""
@@ -192,29 +224,24 @@ class TestPhase4Notes(unittest.TestCase):
     
     def test_note_categories(self):
         """Test all note categories"""
-        categories = [
-            NoteCategory.GENERAL,
-            NoteCategory.RISK_OBSERVATION,
-            NoteCategory.OPPORTUNITY,
-            NoteCategory.COMPLIANCE,
-            NoteCategory.FOLLOWUP,
-        ]
-        for cat in categories:
-            note = AdvisorNote(
-                advisor_id="test",
-                client_id="test",
-                content="Test",
-                category=cat,
-                is_pinned=False,
-            )
-            self.assertEqual(note.category, cat)
+        for cat in NoteCategory:
+            with self.subTest(category=cat):
+                note = AdvisorNote(
+                    advisor_id="test",
+                    client_id="test",
+                    content="Test",
+                    category=cat,
+                    is_pinned=False,
+                )
+                self.assertEqual(note.category, cat)
 
 
 class TestPhase5Escalations(unittest.TestCase):
     """Phase 5: Escalation System Tests"""
     
-    def setUp(self):
-        self.storage = AdvisorStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = AdvisorStorage()
     
     def test_escalation_creation(self):
         """Test creating an escalation ticket"""
@@ -232,23 +259,18 @@ class TestPhase5Escalations(unittest.TestCase):
     
     def test_escalation_reasons(self):
         """Test all escalation reasons"""
-        reasons = [
-            EscalationReason.USER_REQUESTED,
-            EscalationReason.AI_COMPLEXITY,
-            EscalationReason.REGULATORY_QUESTION,
-            EscalationReason.HIGH_VALUE_DECISION,
-        ]
-        for reason in reasons:
-            esc = EscalationTicket(
-                client_id="test",
-                advisor_id="test",
-                reason=reason,
-                context_summary="Test",
-                client_question="Test",
-                status=EscalationStatus.PENDING,
-                priority=EscalationPriority.LOW,
-            )
-            self.assertEqual(esc.reason, reason)
+        for reason in EscalationReason:
+            with self.subTest(reason=reason):
+                esc = EscalationTicket(
+                    client_id="test",
+                    advisor_id="test",
+                    reason=reason,
+                    context_summary="Test",
+                    client_question="Test",
+                    status=EscalationStatus.PENDING,
+                    priority=EscalationPriority.LOW,
+                )
+                self.assertEqual(esc.reason, reason)
     
     def test_escalation_resolution(self):
         """Test escalation resolution workflow"""
@@ -264,14 +286,14 @@ class TestPhase5Escalations(unittest.TestCase):
         
         # Acknowledge
         escalation.status = EscalationStatus.IN_PROGRESS
-        escalation.acknowledged_at = datetime.utcnow().isoformat()
+        escalation.acknowledged_at = _NOW
         self.assertEqual(escalation.status, EscalationStatus.IN_PROGRESS)
         
         # Resolve
         escalation.status = EscalationStatus.RESOLVED
         escalation.resolution_type = ResolutionType.ANSWERED
         escalation.resolution_notes = "Provided detailed explanation"
-        escalation.resolved_at = datetime.utcnow().isoformat()
+        escalation.resolved_at = _NOW
         self.assertEqual(escalation.status, EscalationStatus.RESOLVED)
 
 
@@ -283,7 +305,7 @@ class TestPhase6Appointments(unittest.TestCase):
         appointment = Appointment(
             client_id="demo-user",
             advisor_id="advisor-jane",
-            scheduled_at=(datetime.utcnow() + timedelta(days=1)).isoformat(),
+            scheduled_at=(_NOW_DT + timedelta(days=1)).isoformat(),
             duration_minutes=30,
             timezone="America/New_York",
             meeting_type=MeetingType.PERIODIC_REVIEW,
@@ -295,23 +317,18 @@ class TestPhase6Appointments(unittest.TestCase):
     
     def test_meeting_types(self):
         """Test all meeting types"""
-        types = [
-            MeetingType.INITIAL_CONSULTATION,
-            MeetingType.PERIODIC_REVIEW,
-            MeetingType.ESCALATION_FOLLOWUP,
-            MeetingType.SCENARIO_PLANNING,
-        ]
-        for mt in types:
-            appt = Appointment(
-                client_id="test",
-                advisor_id="test",
-                scheduled_at=datetime.utcnow().isoformat(),
-                duration_minutes=30,
-                timezone="UTC",
-                meeting_type=mt,
-                status=AppointmentStatus.SCHEDULED,
-            )
-            self.assertEqual(appt.meeting_type, mt)
+        for mt in MeetingType:
+            with self.subTest(meeting_type=mt):
+                appt = Appointment(
+                    client_id="test",
+                    advisor_id="test",
+                    scheduled_at=_NOW,
+                    duration_minutes=30,
+                    timezone="UTC",
+                    meeting_type=mt,
+                    status=AppointmentStatus.SCHEDULED,
+                )
+                self.assertEqual(appt.meeting_type, mt)
     
     def test_pre_meeting_brief(self):
         """Test pre-meeting brief generation structure"""
@@ -325,7 +342,7 @@ class TestPhase6Appointments(unittest.TestCase):
                 "key_concerns": ["Savings pace", "Tax optimization"]
             },
             recent_activity={
-                "last_login": datetime.utcnow().isoformat(),
+                "last_login": _NOW,
                 "scenarios_explored": ["Early retirement"],
                 "questions_asked": ["401k limits"]
             },
@@ -341,7 +358,7 @@ class TestPhase6Appointments(unittest.TestCase):
         appt = Appointment(
             client_id="demo-user",
             advisor_id="advisor-jane",
-            scheduled_at=datetime.utcnow().isoformat(),
+            scheduled_at=_NOW,
             duration_minutes=30,
             timezone="UTC",
             meeting_type=MeetingType.PERIODIC_REVIEW,
@@ -362,8 +379,9 @@ class TestPhase6Appointments(unittest.TestCase):
 class TestPhase7RegulatoryChat(unittest.TestCase):
     """Phase 7: Advisor Chat & Regulatory Tests"""
     
-    def setUp(self):
-        self.storage = AdvisorStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = AdvisorStorage()
     
     def test_regulatory_rule_model(self):
         """Test RegulatoryRule model"""
@@ -376,7 +394,7 @@ class TestPhase7RegulatoryChat(unittest.TestCase):
             account_types=["401k", "roth_401k"],
             effective_date="2026-01-01",
             source_url="https://irs.gov",
-            last_verified=datetime.utcnow().isoformat(),
+            last_verified=_NOW,
             is_active=True,
             updated_by="admin-alice",
         )
@@ -385,8 +403,7 @@ class TestPhase7RegulatoryChat(unittest.TestCase):
     
     def test_us_regulatory_rules(self):
         """Test US regulatory rules are loaded"""
-        import asyncio
-        rules = asyncio.run(self.storage.get_regulatory_rules("US"))
+        rules = _run(self.storage.get_regulatory_rules("US"))
         self.assertIsInstance(rules, list)
         
         # Check for expected rules
@@ -395,8 +412,7 @@ class TestPhase7RegulatoryChat(unittest.TestCase):
     
     def test_ca_regulatory_rules(self):
         """Test Canadian regulatory rules are loaded"""
-        import asyncio
-        rules = asyncio.run(self.storage.get_regulatory_rules("CA"))
+        rules = _run(self.storage.get_regulatory_rules("CA"))
         self.assertIsInstance(rules, list)
         
         # Canada should have RRSP/TFSA rules
@@ -411,10 +427,9 @@ class TestPhase8AdminProducts(unittest.TestCase):
     def test_investment_product_structure(self):
         """Test investment product data structure"""
         # Load from file
-        data_path = Path(__file__).parent.parent / "backend" / "data" / "investment_products.json"
+        data_path = DATA_DIR / "investment_products.json"
         if data_path.exists():
-            with open(data_path) as f:
-                data = json.load(f)
+            data = _load_json(str(data_path))
             
             # Handle both list format and grouped format
             if isinstance(data, dict):
@@ -470,7 +485,7 @@ class TestPhase9Compliance(unittest.TestCase):
         item.status = ComplianceStatus.APPROVED
         item.reviewer_id = "admin-alice"
         item.review_notes = "Response is appropriate"
-        item.reviewed_at = datetime.utcnow().isoformat()
+        item.reviewed_at = _NOW
         
         self.assertEqual(item.status, ComplianceStatus.APPROVED)
         self.assertIsNotNone(item.reviewed_at)
@@ -479,8 +494,11 @@ class TestPhase9Compliance(unittest.TestCase):
 class TestIntegration(unittest.TestCase):
     """Integration tests for multi-step workflows"""
     
-    def setUp(self):
-        self.storage = AdvisorStorage()
+    @classmethod
+    def setUpClass(cls):
+        cls.storage = AdvisorStorage()
+        # Read-only snapshot shared by the client checks below
+        cls.jane_clients = tuple(_run(cls.storage.get_clients_for_advisor("advisor-jane")))
     
     def test_escalation_to_appointment_flow(self):
         """Test escalation leading to appointment booking"""
@@ -497,13 +515,13 @@ class TestIntegration(unittest.TestCase):
         
         # Advisor acknowledges and schedules meeting
         escalation.status = EscalationStatus.IN_PROGRESS
-        escalation.acknowledged_at = datetime.utcnow().isoformat()
+        escalation.acknowledged_at = _NOW
         
         # Create linked appointment
         appointment = Appointment(
             client_id=escalation.client_id,
             advisor_id=escalation.advisor_id,
-            scheduled_at=(datetime.utcnow() + timedelta(days=2)).isoformat(),
+            scheduled_at=(_NOW_DT + timedelta(days=2)).isoformat(),
             duration_minutes=45,
             timezone="America/New_York",
             meeting_type=MeetingType.ESCALATION_FOLLOWUP,
@@ -516,7 +534,7 @@ class TestIntegration(unittest.TestCase):
         escalation.status = EscalationStatus.RESOLVED
         escalation.resolution_type = ResolutionType.MEETING_SCHEDULED
         escalation.resolution_notes = f"Meeting scheduled: {appointment.id}"
-        escalation.resolved_at = datetime.utcnow().isoformat()
+        escalation.resolved_at = _NOW
         
         self.assertEqual(escalation.status, EscalationStatus.RESOLVED)
         self.assertEqual(appointment.related_escalation_id, escalation.id)
@@ -524,8 +542,7 @@ class TestIntegration(unittest.TestCase):
     
     def test_client_status_calculation(self):
         """Test client status is properly assigned"""
-        import asyncio
-        clients = asyncio.run(self.storage.get_clients_for_advisor("advisor-jane"))
+        clients = self.jane_clients
         
         statuses = {"healthy": 0, "needs_attention": 0, "critical": 0}
         for client in clients:
@@ -537,8 +554,7 @@ class TestIntegration(unittest.TestCase):
     
     def test_jurisdiction_filtering(self):
         """Test clients can be filtered by jurisdiction"""
-        import asyncio
-        clients = asyncio.run(self.storage.get_clients_for_advisor("advisor-jane"))
+        clients = self.jane_clients
         
         us_clients = [c for c in clients if c.jurisdiction == Jurisdiction.US]
         ca_clients = [c for c in clients if c.jurisdiction == Jurisdiction.CA]
@@ -554,11 +570,10 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_advisor_data_file(self):
         """Test advisors.json is valid"""
-        data_path = Path(__file__).parent.parent / "backend" / "data" / "advisors.json"
+        data_path = DATA_DIR / "advisors.json"
         self.assertTrue(data_path.exists(), "advisors.json should exist")
         
-        with open(data_path) as f:
-            data = json.load(f)
+        data = _load_json(str(data_path))
         
         self.assertIsInstance(data, list)
         self.assertGreater(len(data), 0, "Should have at least one advisor")
@@ -572,21 +587,19 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_admin_data_file(self):
         """Test admins.json is valid"""
-        data_path = Path(__file__).parent.parent / "backend" / "data" / "admins.json"
+        data_path = DATA_DIR / "admins.json"
         self.assertTrue(data_path.exists(), "admins.json should exist")
         
-        with open(data_path) as f:
-            data = json.load(f)
+        data = _load_json(str(data_path))
         
         self.assertIsInstance(data, list)
     
     def test_regulatory_rules_file(self):
         """Test regulatory_rules.json is valid"""
-        data_path = Path(__file__).parent.parent / "backend" / "data" / "regulatory_rules.json"
+        data_path = DATA_DIR / "regulatory_rules.json"
         self.assertTrue(data_path.exists(), "regulatory_rules.json should exist")
         
-        with open(data_path) as f:
-            data = json.load(f)
+        data = _load_json(str(data_path))
         
         self.assertIsInstance(data, list)
         
@@ -597,11 +610,10 @@ class TestDataIntegrity(unittest.TestCase):
     
     def test_user_profiles_have_advisor_fields(self):
         """Test user_profiles.json has advisor-related fields"""
-        data_path = Path(__file__).parent.parent / "backend" / "data" / "user_profiles.json"
+        data_path = DATA_DIR / "user_profiles.json"
         self.assertTrue(data_path.exists())
         
-        with open(data_path) as f:
-            profiles = json.load(f)
+        profiles = _load_json(str(data_path))
         
         for profile in profiles:
             # Should have new advisor-related fields
@@ -611,53 +623,5 @@ class TestDataIntegrity(unittest.TestCase):
             self.assertIn("escalation_enabled", profile)
 
 
-def run_tests():
-    """Run all tests and report results"""
-    loader = unittest.TestLoader()
-    suite = unittest.TestSuite()
-    
-    # Add all test classes
-    test_classes = [
-        TestPhase1Foundation,
-        TestPhase2Dashboard,
-        TestPhase3ClientDetail,
-        TestPhase4Notes,
-        TestPhase5Escalations,
-        TestPhase6Appointments,
-        TestPhase7RegulatoryChat,
-        TestPhase8AdminProducts,
-        TestPhase9Compliance,
-        TestIntegration,
-        TestDataIntegrity,
-    ]
-    
-    for test_class in test_classes:
-        tests = loader.loadTestsFromTestCase(test_class)
-        suite.addTests(tests)
-    
-    # Run tests with verbosity
-    runner = unittest.TextTestRunner(verbosity=2)
-    result = runner.run(suite)
-    
-    # Print summary
-    print("\n" + "=" * 70)
-    print("TEST SUMMARY")
-    print("=" * 70)
-    print(f"Tests Run: {result.testsRun}")
-    print(f"Failures: {len(result.failures)}")
-    print(f"Errors: {len(result.errors)}")
-    print(f"Skipped: {len(result.skipped)}")
-    
-    if result.wasSuccessful():
-        print("\n✅ ALL TESTS PASSED!")
-    else:
-        print("\n❌ SOME TESTS FAILED")
-        for test, trace in result.failures + result.errors:
-            print(f"\n  Failed: {test}")
-    
-    return result.wasSuccessful()
-
-
 if __name__ == "__main__":
-    success = run_tests()
-    sys.exit(0 if success else 1)
+    unittest.main(verbosity=2)
@@ -6,7 +6,11 @@ Tests for advisor and admin API endpoints and data models.
 import unittest
 import asyncio
 import json
+import shutil
 import sys
+import tempfile
+import time
+import uuid
 from pathlib import Path
 
 # Add backend to path
@@ -97,6 +101,15 @@ class TestDataModels(unittest.TestCase):
         self.assertIsNotNone(ticket.id)
         self.assertIsNotNone(ticket.created_at)
     
+    def test_default_ids_are_time_ordered(self):
+        """Test default IDs are UUIDv7 and sort in creation order."""
+        notes = []
+        for _ in range(3):
+            notes.append(AdvisorNote(advisor_id="advisor-1", client_id="client-1", content="note"))
+            time.sleep(0.002)
+        self.assertTrue(all(uuid.UUID(n.id).version == 7 for n in notes))
+        self.assertEqual([n.id for n in notes], sorted(n.id for n in notes))
+    
     def test_advisor_note(self):
         """Test advisor note creation."""
         note = AdvisorNote(
@@ -167,6 +180,25 @@ class TestAdvisorStorage(unittest.TestCase):
         for client in clients:
             self.assertEqual(client.advisor_id, "advisor-jane")
     
+    def test_client_advisor_id_lookup(self):
+        """Test the in-memory client -> advisor index matches the profiles file."""
+        for client in asyncio.run(self.storage.get_all_clients()):
+            self.assertEqual(self.storage.get_client_advisor_id(client.id), client.advisor_id)
+        self.assertIsNone(self.storage.get_client_advisor_id("no-such-client"))
+
+    def test_client_advisor_id_follows_reassignment(self):
+        """Test update_client keeps the client -> advisor index current."""
+        tmp_dir = Path(tempfile.mkdtemp())
+        try:
+            shutil.copy(Path(__file__).parent.parent / "backend" / "data" / "user_profiles.json", tmp_dir)
+            storage = AdvisorStorage(data_dir=tmp_dir)
+            client = asyncio.run(storage.get_all_clients())[0]
+            client.advisor_id = "advisor-reassigned"
+            asyncio.run(storage.update_client(client))
+            self.assertEqual(storage.get_client_advisor_id(client.id), "advisor-reassigned")
+        finally:
+            shutil.rmtree(tmp_dir)
+
     def test_client_jurisdictions(self):
         """Test that clients have proper jurisdiction assignments."""
         clients = asyncio.run(self.storage.get_all_clients())